@@ -0,0 +1,92 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+
+from . import load, memory, speed
+from .report import Report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the Kitsu.py benchmarks offline.")
+    parser.add_argument(
+        "suite", nargs="?", choices=("speed", "memory", "load"), default="speed", help="the benchmarks to run"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds of simulated latency per request")
+    parser.add_argument("--requests", type=int, default=2000, help="number of requests for the throughput benchmarks")
+    parser.add_argument("--concurrency", type=int, default=50, help="number of requests in flight at once")
+    parser.add_argument("--output", help="write the report as JSON to this path")
+    parser.add_argument("--compare", help="compare against a JSON report written by --output")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed regression as a fraction, default 0.1")
+    parser.add_argument("--count", type=int, default=2000, help="number of objects built by the memory benchmarks")
+    parser.add_argument("--update-baseline", action="store_true", help="store the memory report as the new baseline")
+    parser.add_argument("--users", type=int, default=5000, help="number of concurrent users in the load test")
+    parser.add_argument("--commands", type=int, default=20000, help="number of commands issued in the load test")
+    parser.add_argument("--connections", type=int, default=100, help="connection pool size in the load test")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds of latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 500")
+    args = parser.parse_args()
+
+    if args.suite == "memory":
+        report = memory.run(count=args.count)
+
+        if args.update_baseline:
+            report.save(str(memory.BASELINE))
+
+        # The memory benchmarks are deterministic, so they always gate on the stored baseline
+        if args.compare is None and memory.BASELINE.exists():
+            args.compare = str(memory.BASELINE)
+    elif args.suite == "load":
+        report = load.run(
+            users=args.users,
+            total=args.commands,
+            connections=args.connections,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+        )
+    else:
+        report = speed.run(latency=args.latency, requests=args.requests, concurrency=args.concurrency)
+
+    baseline = Report.load(args.compare) if args.compare else None
+
+    if baseline is not None and baseline.meta.get("python") != report.meta["python"]:
+        print(f"Warning: the baseline was recorded on Python {baseline.meta.get('python')}", file=sys.stderr)
+
+    print(report.render(baseline))
+
+    if args.output:
+        report.save(args.output)
+
+    if baseline is not None and (regressed := report.regressions(baseline, args.threshold)):
+        print(f"\nRegressed by more than {args.threshold:.0%}: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
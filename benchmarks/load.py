@@ -0,0 +1,159 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import aiohttp
+
+import kitsu
+
+from .report import Report
+from .server import anime_resource, serve_in_thread
+
+# The weights of the commands a bot user issues, roughly matching production traffic
+MIX: Dict[str, float] = {
+    "get_anime": 0.4,
+    "search_anime": 0.3,
+    "trending_anime": 0.2,
+    "get_episodes": 0.1,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Returns the value at ``fraction`` of the sorted values, using the nearest rank."""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def commands(client: kitsu.Client, catalogue_size: int) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    def get_episodes() -> Awaitable[Any]:
+        anime = kitsu.Anime(anime_resource(random.randint(1, catalogue_size)), client)
+        return anime.get_episodes()
+
+    return {
+        "get_anime": lambda: client.get_anime(random.randint(1, catalogue_size)),
+        "search_anime": lambda: client.search_anime(text="bebop", limit=random.randint(5, 20)),
+        "trending_anime": client.trending_anime,
+        "get_episodes": get_episodes,
+    }
+
+
+async def monitor_lag(lags: List[float], stop: asyncio.Event, interval: float = 0.01) -> None:
+    """Records how late the event loop wakes up from a sleep of ``interval`` seconds."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def drive(
+    base_url: str, *, users: int, total: int, connections: int, catalogue_size: int
+) -> Tuple[Dict[str, List[float]], Counter, float, List[float]]:
+    connector = aiohttp.TCPConnector(limit=connections)
+    client = kitsu.Client(aiohttp.ClientSession(connector=connector), base_url=base_url)
+    available = commands(client, catalogue_size)
+    names, weights = list(MIX), list(MIX.values())
+
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Counter = Counter()
+    remaining = total
+
+    async def user() -> None:
+        nonlocal remaining
+
+        while remaining > 0:
+            remaining -= 1
+            name = random.choices(names, weights)[0]
+            start = time.perf_counter()
+
+            try:
+                await available[name]()
+            except kitsu.HTTPException as error:
+                errors[error.status] += 1
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                errors[type(error).__name__] += 1
+            else:
+                latencies[name].append(time.perf_counter() - start)
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(lags, stop))
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(user() for _ in range(users)))
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await monitor
+        await client.close()
+
+    return latencies, errors, elapsed, lags
+
+
+def run(
+    *,
+    users: int = 5000,
+    total: int = 20000,
+    connections: int = 100,
+    latency: float = 0.05,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    catalogue_size: int = 1000,
+    episode_count: int = 40,
+) -> Report:
+    """Simulates ``users`` concurrent bot users issuing ``total`` commands between them."""
+    options = dict(
+        latency=latency, jitter=jitter, error_rate=error_rate, catalogue_size=catalogue_size, episode_count=episode_count
+    )
+
+    with serve_in_thread(**options) as server:
+        latencies, errors, elapsed, lags = asyncio.run(
+            drive(server.url, users=users, total=total, connections=connections, catalogue_size=catalogue_size)
+        )
+        sockets = len(server.connections)
+        requests = server.requests
+
+    report = Report()
+    everything = [value for values in latencies.values() for value in values]
+
+    for name, values in (("all", everything), *latencies.items()):
+        for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            report.add(f"load.{name}.{label}", percentile(values, fraction) * 1000, "ms", "lower")
+
+    report.add("load.throughput", total / elapsed, "cmd/s", "higher")
+    report.add("load.requests", requests / elapsed, "req/s", "higher")
+    report.add("load.errors", sum(errors.values()), "cmds", "lower")
+    report.add("load.sockets", sockets, "sockets", "lower")
+    report.add("load.loop_lag.p99", percentile(lags, 0.99) * 1000, "ms", "lower")
+    report.add("load.loop_lag.max", max(lags, default=0.0) * 1000, "ms", "lower")
+    return report
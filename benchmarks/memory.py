@@ -0,0 +1,82 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List
+
+import kitsu
+
+from .report import Report
+from .server import anime_resource, episode_resource, manga_resource
+
+BASELINE = Path(__file__).parent / "memory_baseline.json"
+PAGE_SIZE = 20
+
+
+def traced_size(build: Callable[[], Any]) -> int:
+    """Returns the number of bytes still allocated by the objects ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del objects
+    return after - before
+
+
+def _raw_pages(resources: List[Any]) -> List[bytes]:
+    pages = [resources[i : i + PAGE_SIZE] for i in range(0, len(resources), PAGE_SIZE)]
+    return [json.dumps({"data": page}).encode() for page in pages]
+
+
+def bench_model(report: Report, name: str, resources: List[Any], build: Callable[[Any], Any]) -> None:
+    # The payloads are decoded while tracing so the retained ``_data`` and
+    # ``_attributes`` dicts are counted with the objects that keep them alive.
+    raw = [json.dumps(resource).encode() for resource in resources]
+    size = traced_size(lambda: [build(json.loads(item)) for item in raw])
+    report.add(f"memory.{name}", size / len(raw), "B/obj", "lower")
+
+    pages = _raw_pages(resources)
+    size = traced_size(lambda: [[build(item) for item in json.loads(page)["data"]] for page in pages])
+    report.add(f"memory.{name}_page", size / len(pages), "B/page", "lower")
+
+
+def run(*, count: int = 2000) -> Report:
+    """Builds ``count`` of every model from the fixtures and reports their footprint."""
+    client: Any = None  # The models only keep a reference to the client
+    report = Report()
+
+    bench_model(report, "anime", [anime_resource(i) for i in range(1, count + 1)], lambda data: kitsu.Anime(data, client))
+    bench_model(report, "manga", [manga_resource(i) for i in range(1, count + 1)], lambda data: kitsu.Manga(data, client))
+    bench_model(report, "episode", [episode_resource(1, n) for n in range(1, count + 1)], kitsu.Episode)
+    return report
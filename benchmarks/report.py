@@ -0,0 +1,99 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional
+
+import kitsu
+
+
+class Report:
+    """Collects benchmark results and compares them against an earlier report.
+
+    Each result records whether a ``higher`` or ``lower`` value is better, so
+    reports can be compared without knowing what every benchmark measures.
+    """
+
+    def __init__(self, results: Optional[Dict[str, Dict[str, Any]]] = None, meta: Optional[Dict[str, Any]] = None) -> None:
+        self.results: Dict[str, Dict[str, Any]] = results or {}
+        self.meta: Dict[str, Any] = meta or {
+            "kitsu": kitsu.__version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+    def add(self, name: str, value: float, unit: str, better: Literal["higher", "lower"]) -> None:
+        self.results[name] = {"value": value, "unit": unit, "better": better}
+
+    def merge(self, other: Report) -> None:
+        self.results.update(other.results)
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"meta": self.meta, "results": self.results}, file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> Report:
+        with open(path, encoding="utf-8") as file:
+            payload = json.load(file)
+
+        return cls(payload["results"], payload["meta"])
+
+    def regressions(self, baseline: Report, threshold: float) -> List[str]:
+        """Returns the names of results that are worse than ``baseline`` by more than ``threshold``."""
+        regressed = []
+
+        for name, result in self.results.items():
+            if (previous := baseline.results.get(name)) is None or not previous["value"]:
+                continue
+
+            change = (result["value"] - previous["value"]) / previous["value"]
+
+            if result["better"] == "higher":
+                change = -change
+
+            if change > threshold:
+                regressed.append(name)
+
+        return regressed
+
+    def render(self, baseline: Optional[Report] = None) -> str:
+        lines = []
+        width = max((len(name) for name in self.results), default=0)
+
+        for name, result in self.results.items():
+            line = f"{name:<{width}}  {result['value']:>14,.2f} {result['unit']}"
+
+            if baseline is not None and (previous := baseline.results.get(name)) is not None and previous["value"]:
+                change = (result["value"] - previous["value"]) / previous["value"] * 100
+                line += f"  ({change:+.1f}%)"
+
+            lines.append(line)
+
+        return "\n".join(lines)
@@ -0,0 +1,744 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# A local stand-in for the Kitsu API serving recorded JSON:API fixtures.
+#
+# Run it on its own with ``python -m benchmarks.server --port 8080 --latency 0.05``
+# or start it in a background thread with ``serve_in_thread``.
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).parent / "fixtures"
+CONTENT_TYPE = "application/vnd.api+json"
+PREFIX = "/api/edge"
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name: str) -> Dict[str, Any]:
+    """Loads a recorded resource from the fixtures folder."""
+    with open(FIXTURES / f"{name}.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _updated_at(resource_id: int) -> str:
+    # Lower ids were updated more recently, so the catalogue has a stable -updatedAt order
+    moment = datetime(2023, 3, 1, 12, tzinfo=timezone.utc) - timedelta(minutes=resource_id)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def anime_resource(anime_id: int) -> Dict[str, Any]:
+    """Builds an anime resource from the recorded fixture with the given id."""
+    data = copy.deepcopy(load_fixture("anime"))
+    attributes = data["attributes"]
+
+    data["id"] = str(anime_id)
+    data["links"]["self"] = f"https://kitsu.io/api/edge/anime/{anime_id}"
+    attributes["slug"] = f"{attributes['slug']}-{anime_id}"
+    attributes["titles"]["en"] = f"{attributes['titles']['en']} {anime_id}"
+    attributes["canonicalTitle"] = attributes["titles"]["en"]
+    attributes["userCount"] = attributes["userCount"] - anime_id
+    attributes["popularityRank"] = anime_id
+    attributes["ratingRank"] = anime_id
+    attributes["updatedAt"] = _updated_at(anime_id)
+    return data
+
+
+def manga_resource(manga_id: int) -> Dict[str, Any]:
+    """Builds a manga resource from the recorded fixture with the given id."""
+    data = copy.deepcopy(load_fixture("manga"))
+    attributes = data["attributes"]
+
+    data["id"] = str(manga_id)
+    data["links"]["self"] = f"https://kitsu.io/api/edge/manga/{manga_id}"
+    attributes["slug"] = f"{attributes['slug']}-{manga_id}"
+    attributes["titles"]["en"] = f"{attributes['titles']['en']} {manga_id}"
+    attributes["canonicalTitle"] = attributes["titles"]["en"]
+    attributes["userCount"] = attributes["userCount"] - manga_id
+    attributes["popularityRank"] = manga_id
+    attributes["ratingRank"] = manga_id
+    attributes["updatedAt"] = _updated_at(manga_id)
+    return data
+
+
+def episode_resource(anime_id: int, number: int) -> Dict[str, Any]:
+    """Builds the ``number``-th episode of an anime from the recorded fixture."""
+    data = copy.deepcopy(load_fixture("episode"))
+    attributes = data["attributes"]
+    episode_id = anime_id * 10000 + number
+
+    data["id"] = str(episode_id)
+    data["links"]["self"] = f"https://kitsu.io/api/edge/episodes/{episode_id}"
+    attributes["number"] = number
+    attributes["relativeNumber"] = number
+    attributes["canonicalTitle"] = f"{attributes['canonicalTitle']} {number}"
+    attributes["airdate"] = (datetime(2023, 1, 1) + timedelta(weeks=number - 1, days=anime_id % 7)).strftime("%Y-%m-%d")
+    return data
+
+
+def chapter_resource(manga_id: int, number: int) -> Dict[str, Any]:
+    """Builds the ``number``-th chapter of a manga from the recorded fixture."""
+    data = copy.deepcopy(load_fixture("chapter"))
+    attributes = data["attributes"]
+    chapter_id = manga_id * 10000 + number
+
+    data["id"] = str(chapter_id)
+    data["links"]["self"] = f"https://kitsu.io/api/edge/chapters/{chapter_id}"
+    attributes["number"] = number
+    attributes["volumeNumber"] = (number - 1) // 10 + 1
+    attributes["canonicalTitle"] = f"{attributes['canonicalTitle']} {number}"
+    return data
+
+
+class StandInServer:
+    """Serves a synthetic Kitsu catalogue built from the recorded fixtures.
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host to bind to.
+    port: :class:`int`
+        The port to bind to, ``0`` picks a free port.
+    latency: :class:`float`
+        Seconds to wait before answering each request.
+    jitter: :class:`float`
+        Up to this many extra seconds, chosen at random, are added to ``latency``.
+    error_rate: :class:`float`
+        The fraction of requests answered with a ``500`` error.
+    catalogue_size: :class:`int`
+        The number of anime and manga in the catalogue, ids run from 1 to this value.
+    episode_count: :class:`int`
+        The number of episodes of every anime.
+    chapter_count: :class:`int`
+        The number of chapters of every manga.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        catalogue_size: int = 1000,
+        episode_count: int = 100,
+        chapter_count: int = 200,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.catalogue_size = catalogue_size
+        self.episode_count = episode_count
+        self.chapter_count = chapter_count
+        self.requests = 0
+        self.connections: Set[Any] = set()
+        self.updated: Dict[Tuple[str, int], str] = {}
+        self.persisted: Dict[str, str] = {}
+
+        self._runner: Optional[web.AppRunner] = None
+
+    def touch(self, kind: str, ids: List[int]) -> None:
+        """Marks resources as updated now, moving them to the front of the ``-updatedAt`` order."""
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+        for resource_id in ids:
+            self.updated[(kind, resource_id)] = now
+
+    def _resource(self, kind: str, resource_id: int) -> Dict[str, Any]:
+        data = anime_resource(resource_id) if kind == "anime" else manga_resource(resource_id)
+
+        if (updated_at := self.updated.get((kind, resource_id))) is not None:
+            data["attributes"]["updatedAt"] = updated_at
+
+        return data
+
+    def _ordered(self, request: web.Request, kind: str) -> List[int]:
+        ids = list(range(1, self.catalogue_size + 1))
+
+        if request.query.get("sort") == "-updatedAt":
+            ids.sort(key=lambda i: (self.updated.get((kind, i), _updated_at(i)), i), reverse=True)
+
+        return ids
+
+    @property
+    def url(self) -> str:
+        """The base URL to pass to :class:`kitsu.Client`."""
+        return f"http://{self.host}:{self.port}{PREFIX}"
+
+    def application(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(f"{PREFIX}/anime", self._anime_collection)
+        app.router.add_get(f"{PREFIX}/anime/{{id}}", self._anime)
+        app.router.add_get(f"{PREFIX}/anime/{{id}}/episodes", self._episodes)
+        app.router.add_get(f"{PREFIX}/trending/anime", self._trending_anime)
+        app.router.add_get(f"{PREFIX}/manga", self._manga_collection)
+        app.router.add_get(f"{PREFIX}/manga/{{id}}", self._manga)
+        app.router.add_get(f"{PREFIX}/manga/{{id}}/chapters", self._chapters)
+        app.router.add_get(f"{PREFIX}/trending/manga", self._trending_manga)
+        app.router.add_get(f"{PREFIX}/anime/{{id}}/installments", self._media_installments)
+        app.router.add_get(f"{PREFIX}/manga/{{id}}/installments", self._media_installments)
+        app.router.add_get(f"{PREFIX}/franchises/{{id}}/installments", self._franchise_installments)
+        app.router.add_get(f"{PREFIX}/mappings", self._mappings)
+        app.router.add_get(f"{PREFIX.rsplit('/', 1)[0]}/graphql", self._graphql)
+        app.router.add_get(f"{PREFIX}/categories", self._categories)
+        app.router.add_get(f"{PREFIX}/anime/{{id}}/relationships/categories", self._media_categories)
+        app.router.add_get(f"{PREFIX}/manga/{{id}}/relationships/categories", self._media_categories)
+        app.router.add_get(f"{PREFIX}/anime/{{id}}/mappings", self._media_mappings)
+        app.router.add_get(f"{PREFIX}/manga/{{id}}/mappings", self._media_mappings)
+        return app
+
+    async def start(self) -> str:
+        self._runner = web.AppRunner(self.application(), access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        self.port = self._runner.addresses[0][1]
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername") if request.transport else None)
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        if self.error_rate and random.random() < self.error_rate:
+            error = {"title": "Internal Server Error", "detail": "Injected error.", "code": "500", "status": "500"}
+            return self._json({"errors": [error]}, 500)
+
+        return await handler(request)
+
+    @staticmethod
+    def _json(payload: Any, status: int = 200) -> web.Response:
+        return web.Response(body=json.dumps(payload).encode(), status=status, content_type=CONTENT_TYPE)
+
+    def _not_found(self, resource_id: str) -> web.Response:
+        detail = f"The record identified by {resource_id} could not be found."
+        return self._json({"errors": [{"title": "Record not found", "detail": detail, "code": "404", "status": "404"}]}, 404)
+
+    def _lookup(self, request: web.Request) -> Optional[int]:
+        try:
+            resource_id = int(request.match_info["id"])
+        except ValueError:
+            return None
+
+        return resource_id if 1 <= resource_id <= self.catalogue_size else None
+
+    def _collection(
+        self,
+        request: web.Request,
+        data: List[Dict[str, Any]],
+        total: int,
+        offset: int,
+        limit: int,
+        included: Optional[List[Dict[str, Any]]] = None,
+    ) -> web.Response:
+        def page(page_offset: int) -> str:
+            query = dict(request.query)
+            query["page[limit]"] = str(limit)
+            query["page[offset]"] = str(page_offset)
+            return str(request.url.with_query(query))
+
+        # Like the Kitsu paginator, the last page is the final ``limit`` resources rather than a page boundary
+        last = max(total - limit, 0)
+        links = {"first": page(0), "last": page(last)}
+
+        if offset > 0:
+            links["prev"] = page(max(offset - limit, 0))
+
+        if offset + limit < total:
+            links["next"] = page(offset + limit)
+
+        payload: Dict[str, Any] = {"data": data, "meta": {"count": total}, "links": links}
+
+        if included is not None:
+            payload["included"] = included
+
+        return self._json(payload)
+
+    @staticmethod
+    def _page(request: web.Request, default: int = 10, maximum: int = 20) -> Tuple[int, int]:
+        limit = max(min(int(request.query.get("page[limit]", default)), maximum), 1)
+        offset = max(int(request.query.get("page[offset]", 0)), 0)
+        return offset, limit
+
+    async def _anime(self, request: web.Request) -> web.Response:
+        anime_id = self._lookup(request)
+
+        if anime_id is None:
+            return self._not_found(request.match_info["id"])
+
+        payload: Dict[str, Any] = {"data": self._resource("anime", anime_id)}
+
+        if "episodes" in request.query.get("include", "").split(","):
+            payload["included"] = [episode_resource(anime_id, n) for n in range(1, self.episode_count + 1)]
+
+        return self._json(payload)
+
+    def _media_collection(self, request: web.Request, kind: str) -> web.Response:
+        offset, limit = self._page(request)
+
+        if (slug := request.query.get("filter[slug]")) is not None:
+            # Slugs end with the id of the media, see anime_resource and manga_resource
+            suffix = slug.rpartition("-")[2]
+            resource_id = int(suffix) if suffix.isdigit() and 1 <= int(suffix) <= self.catalogue_size else None
+            data = [self._resource(kind, resource_id)] if resource_id is not None else []
+            return self._collection(request, [item for item in data if item["attributes"]["slug"] == slug], 1, 0, limit)
+
+        ids = self._ordered(request, kind)[offset : offset + limit]
+        return self._collection(request, [self._resource(kind, i) for i in ids], self.catalogue_size, offset, limit)
+
+    async def _anime_collection(self, request: web.Request) -> web.Response:
+        return self._media_collection(request, "anime")
+
+    async def _episodes(self, request: web.Request) -> web.Response:
+        anime_id = self._lookup(request)
+
+        if anime_id is None:
+            return self._not_found(request.match_info["id"])
+
+        offset, limit = self._page(request)
+        numbers = range(offset + 1, min(offset + limit, self.episode_count) + 1)
+        return self._collection(request, [episode_resource(anime_id, n) for n in numbers], self.episode_count, offset, limit)
+
+    async def _trending_anime(self, request: web.Request) -> web.Response:
+        return self._json({"data": [anime_resource(i) for i in range(1, min(10, self.catalogue_size) + 1)]})
+
+    async def _manga(self, request: web.Request) -> web.Response:
+        manga_id = self._lookup(request)
+
+        if manga_id is None:
+            return self._not_found(request.match_info["id"])
+
+        return self._json({"data": self._resource("manga", manga_id)})
+
+    async def _chapters(self, request: web.Request) -> web.Response:
+        manga_id = self._lookup(request)
+
+        if manga_id is None:
+            return self._not_found(request.match_info["id"])
+
+        offset, limit = self._page(request)
+        numbers = range(offset + 1, min(offset + limit, self.chapter_count) + 1)
+        return self._collection(request, [chapter_resource(manga_id, n) for n in numbers], self.chapter_count, offset, limit)
+
+    async def _manga_collection(self, request: web.Request) -> web.Response:
+        return self._media_collection(request, "manga")
+
+    async def _trending_manga(self, request: web.Request) -> web.Response:
+        return self._json({"data": [manga_resource(i) for i in range(1, min(10, self.catalogue_size) + 1)]})
+
+    # Franchise f holds anime 10f-9 to 10f and manga f. The last anime of a franchise
+    # also belongs to the next one, except for every third franchise, so franchises
+    # link up into components of three.
+
+    def _franchise_count(self) -> int:
+        return -(-self.catalogue_size // 10)
+
+    def _franchises_of(self, kind: str, media_id: int) -> List[int]:
+        if kind == "manga":
+            return [media_id] if media_id <= self._franchise_count() else []
+
+        franchise = (media_id - 1) // 10 + 1
+        franchises = [franchise]
+
+        if media_id % 10 == 0 and franchise % 3 != 0 and franchise < self._franchise_count():
+            franchises.append(franchise + 1)
+
+        return franchises
+
+    def _members(self, franchise: int) -> List[Tuple[str, int]]:
+        members = [("anime", i) for i in range(10 * franchise - 9, min(10 * franchise, self.catalogue_size) + 1)]
+
+        if franchise > 1 and (franchise - 1) % 3 != 0:
+            members.insert(0, ("anime", 10 * (franchise - 1)))
+
+        return [*members, ("manga", franchise)]
+
+    @staticmethod
+    def _installment(franchise: int, position: int, kind: str, media_id: int) -> Dict[str, Any]:
+        return {
+            "id": str(franchise * 1000 + position),
+            "type": "installments",
+            "attributes": {"tag": "Sequel" if position else None, "position": position},
+            "relationships": {
+                "franchise": {"data": {"type": "franchises", "id": str(franchise)}},
+                "media": {"data": {"type": kind, "id": str(media_id)}},
+            },
+        }
+
+    async def _media_installments(self, request: web.Request) -> web.Response:
+        kind = request.path.split("/")[-3]
+        media_id = self._lookup(request)
+
+        if media_id is None:
+            return self._not_found(request.match_info["id"])
+
+        data, included = [], []
+
+        for franchise in self._franchises_of(kind, media_id):
+            position = self._members(franchise).index((kind, media_id))
+            data.append(self._installment(franchise, position, kind, media_id))
+            included.append(
+                {"id": str(franchise), "type": "franchises", "attributes": {"canonicalTitle": f"Franchise {franchise}"}}
+            )
+
+        return self._json({"data": data, "included": included, "meta": {"count": len(data)}, "links": {}})
+
+    async def _franchise_installments(self, request: web.Request) -> web.Response:
+        franchise = int(request.match_info["id"])
+
+        if not 1 <= franchise <= self._franchise_count():
+            return self._not_found(request.match_info["id"])
+
+        members = self._members(franchise)
+        offset, limit = self._page(request)
+        page = list(enumerate(members))[offset : offset + limit]
+        data = [self._installment(franchise, position, *member) for position, member in page]
+        included = None
+
+        if "media" in request.query.get("include", "").split(","):
+            included = [self._resource(kind, media_id) for _, (kind, media_id) in page]
+
+        return self._collection(request, data, len(members), offset, limit, included)
+
+    # Media n is id 3n on MyAnimeList and 3n + 1 on AniList.
+
+    SITES = ("myanimelist", "anilist")
+
+    @staticmethod
+    def _mapping(kind: str, media_id: int, site: int) -> Dict[str, Any]:
+        return {
+            "id": str(media_id * 4 + site * 2 + (kind == "manga")),
+            "type": "mappings",
+            "attributes": {
+                "externalSite": f"{StandInServer.SITES[site]}/{kind}",
+                "externalId": str(media_id * 3 + site),
+            },
+            "relationships": {"item": {"data": {"type": kind, "id": str(media_id)}}},
+        }
+
+    async def _mappings(self, request: web.Request) -> web.Response:
+        site_name, _, kind = request.query.get("filter[externalSite]", "").partition("/")
+        data, included = [], []
+
+        if site_name in self.SITES and kind in ("anime", "manga"):
+            site = self.SITES.index(site_name)
+
+            for external_id in request.query.get("filter[externalId]", "").split(","):
+                media_id, remainder = divmod(int(external_id), 3) if external_id.isdigit() else (0, -1)
+
+                if remainder == site and 1 <= media_id <= self.catalogue_size:
+                    data.append(self._mapping(kind, media_id, site))
+                    included.append(self._resource(kind, media_id))
+
+        offset, limit = self._page(request)
+        page = slice(offset, offset + limit)
+
+        if "item" not in request.query.get("include", "").split(","):
+            return self._collection(request, data[page], len(data), offset, limit)
+
+        return self._collection(request, data[page], len(data), offset, limit, included[page])
+
+    async def _media_mappings(self, request: web.Request) -> web.Response:
+        kind = request.path.split("/")[-3]
+        media_id = self._lookup(request)
+
+        if media_id is None:
+            return self._not_found(request.match_info["id"])
+
+        data = [self._mapping(kind, media_id, site) for site in range(len(self.SITES))]
+        return self._collection(request, data, len(data), 0, 20)
+
+    # There are CATEGORY_COUNT categories, the first ten are the parents of the rest
+    # and media n is in categories n, 7n and 13n modulo CATEGORY_COUNT.
+
+    CATEGORY_COUNT = 110
+
+    @staticmethod
+    def _category(category_id: int) -> Dict[str, Any]:
+        parent = None if category_id <= 10 else {"type": "categories", "id": str((category_id - 1) % 10 + 1)}
+
+        return {
+            "id": str(category_id),
+            "type": "categories",
+            "links": {"self": f"https://kitsu.io/api/edge/categories/{category_id}"},
+            "attributes": {
+                "createdAt": "2017-05-31T06:38:26.218Z",
+                "updatedAt": "2017-05-31T06:38:26.218Z",
+                "title": f"Category {category_id}",
+                "description": None,
+                "slug": f"category-{category_id}",
+                "nsfw": False,
+                "childCount": 10 if category_id <= 10 else 0,
+                "totalMediaCount": 0,
+            },
+            "relationships": {"parent": {"data": parent}},
+        }
+
+    async def _categories(self, request: web.Request) -> web.Response:
+        offset, limit = self._page(request)
+        ids = range(offset + 1, min(offset + limit, self.CATEGORY_COUNT) + 1)
+        return self._collection(request, [self._category(i) for i in ids], self.CATEGORY_COUNT, offset, limit)
+
+    async def _media_categories(self, request: web.Request) -> web.Response:
+        media_id = self._lookup(request)
+
+        if media_id is None:
+            return self._not_found(request.match_info["id"])
+
+        ids = dict.fromkeys(media_id * factor % self.CATEGORY_COUNT + 1 for factor in (1, 7, 13))
+        return self._json({"data": [{"type": "categories", "id": str(i)} for i in ids]})
+
+    # The GraphQL API answers the detail queries of kitsu.graphql, built from the same
+    # resources as the REST API, and supports persisted queries.
+
+    @staticmethod
+    def _graphql_image(payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if payload is None:
+            return None
+
+        dimensions = payload.get("meta", {}).get("dimensions", {})
+        views = [
+            {"name": size, "url": payload[size], **dimensions.get(size, {"width": None, "height": None})}
+            for size in ("tiny", "small", "medium", "large")
+            if payload.get(size) is not None
+        ]
+        return {"original": {"url": payload["original"], "width": None, "height": None}, "views": views}
+
+    @staticmethod
+    def _graphql_unit(resource: Dict[str, Any]) -> Dict[str, Any]:
+        attributes = resource["attributes"]
+        released_at = attributes.get("airdate") or attributes.get("published")
+        length = attributes["length"]
+
+        return {
+            "id": resource["id"],
+            "number": attributes["number"],
+            "titles": {"canonical": attributes["canonicalTitle"], "localized": attributes["titles"], "alternatives": []},
+            "description": {"en": attributes["synopsis"]},
+            "releasedAt": None if released_at is None else f"{released_at}T00:00:00Z",
+            "length": None if length is None else length * 60,
+            "createdAt": attributes["createdAt"],
+            "updatedAt": attributes["updatedAt"],
+            "volume": {"number": attributes["volumeNumber"]} if "volumeNumber" in attributes else None,
+            "thumbnail": None,
+        }
+
+    def _graphql_media(self, kind: str, media_id: int, variables: Dict[str, Any]) -> Dict[str, Any]:
+        attributes = self._resource(kind, media_id)["attributes"]
+        categories = dict.fromkeys(media_id * factor % self.CATEGORY_COUNT + 1 for factor in (1, 7, 13))
+        node: Dict[str, Any] = {
+            "id": str(media_id),
+            "slug": attributes["slug"],
+            "titles": {
+                "canonical": attributes["canonicalTitle"],
+                "localized": attributes["titles"],
+                "alternatives": attributes["abbreviatedTitles"],
+            },
+            "description": {"en": attributes["synopsis"]},
+            "averageRating": None if attributes["averageRating"] is None else float(attributes["averageRating"]),
+            "averageRatingRank": attributes["ratingRank"],
+            "userCount": attributes["userCount"],
+            "userCountRank": attributes["popularityRank"],
+            "favoritesCount": attributes["favoritesCount"],
+            "startDate": attributes["startDate"],
+            "endDate": attributes["endDate"],
+            "ageRating": attributes["ageRating"],
+            "ageRatingGuide": attributes["ageRatingGuide"],
+            "status": attributes["status"].upper(),
+            "sfw": not attributes.get("nsfw", False),
+            "createdAt": attributes["createdAt"],
+            "updatedAt": attributes["updatedAt"],
+            "posterImage": self._graphql_image(attributes["posterImage"]),
+            "bannerImage": self._graphql_image(attributes["coverImage"]),
+            "subtype": attributes["subtype"].upper(),
+            "categories": {"nodes": []},
+            "mappings": {"nodes": []},
+        }
+
+        for category_id in categories:
+            category = self._category(category_id)
+            parent = category["relationships"]["parent"]["data"]
+            node["categories"]["nodes"].append(
+                {
+                    "id": category["id"],
+                    "slug": category["attributes"]["slug"],
+                    "title": {"en": category["attributes"]["title"]},
+                    "description": {},
+                    "isNsfw": category["attributes"]["nsfw"],
+                    "createdAt": category["attributes"]["createdAt"],
+                    "updatedAt": category["attributes"]["updatedAt"],
+                    "parent": None if parent is None else {"id": parent["id"]},
+                }
+            )
+
+        for site in range(len(self.SITES)):
+            mapping = self._mapping(kind, media_id, site)["attributes"]
+            external_site = mapping["externalSite"].replace("/", "_").upper()
+            node["mappings"]["nodes"].append({"externalSite": external_site, "externalId": mapping["externalId"]})
+
+        if kind == "anime":
+            count = min(int(variables.get("episodes", 10)), self.episode_count)
+            episodes = [self._graphql_unit(episode_resource(media_id, n)) for n in range(1, count + 1)]
+            node.update(
+                episodeCount=attributes["episodeCount"],
+                episodeLength=attributes["episodeLength"] * 60,
+                youtubeTrailerVideoId=attributes["youtubeVideoId"],
+                episodes={"nodes": episodes},
+            )
+        else:
+            count = min(int(variables.get("chapters", 10)), self.chapter_count)
+            chapters = [self._graphql_unit(chapter_resource(media_id, n)) for n in range(1, count + 1)]
+            node.update(
+                chapterCount=attributes["chapterCount"],
+                volumeCount=attributes["volumeCount"],
+                serialization=attributes["serialization"],
+                chapters={"nodes": chapters},
+            )
+
+        return node
+
+    async def _graphql(self, request: web.Request) -> web.Response:
+        query = request.query.get("query")
+        extensions = json.loads(request.query.get("extensions", "{}"))
+        digest = extensions.get("persistedQuery", {}).get("sha256Hash")
+
+        if query is None:
+            if digest not in self.persisted:
+                error = {"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}
+                return self._json({"errors": [error]})
+
+            query = self.persisted[digest]
+        elif digest is not None:
+            if hashlib.sha256(query.encode()).hexdigest() != digest:
+                return self._json({"errors": [{"message": "provided sha does not match query"}]})
+
+            self.persisted[digest] = query
+
+        variables = json.loads(request.query.get("variables", "{}"))
+
+        for field, kind in (("findAnimeById", "anime"), ("findMangaById", "manga")):
+            if field in query:
+                media_id = int(variables.get("id", 0))
+
+                if not 1 <= media_id <= self.catalogue_size:
+                    return self._json({"data": {field: None}})
+
+                return self._json({"data": {field: self._graphql_media(kind, media_id, variables)}})
+
+        return self._json({"errors": [{"message": "The stand-in server only answers the queries of kitsu.graphql"}]})
+
+
+@contextmanager
+def serve_in_thread(**options: Any) -> Iterator[StandInServer]:
+    """Runs a :class:`StandInServer` on its own event loop in a background thread.
+
+    The server does not share the benchmarked event loop, so its own work does
+    not show up in the client measurements.
+    """
+    server = StandInServer(**options)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(server.close())
+        loop.close()
+
+    thread = threading.Thread(target=run, name="kitsu-stand-in", daemon=True)
+    thread.start()
+    started.wait()
+
+    try:
+        yield server
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the local Kitsu stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds of latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 500")
+    parser.add_argument("--catalogue-size", type=int, default=1000)
+    parser.add_argument("--episode-count", type=int, default=100)
+    parser.add_argument("--chapter-count", type=int, default=200)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        catalogue_size=args.catalogue_size,
+        episode_count=args.episode_count,
+        chapter_count=args.chapter_count,
+    )
+
+    async def run() -> None:
+        print(f"Serving on {await server.start()}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
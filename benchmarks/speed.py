@@ -0,0 +1,108 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable
+
+import kitsu
+
+from .report import Report
+from .server import anime_resource, episode_resource, manga_resource, serve_in_thread
+
+
+def construction_rate(build: Callable[[], Any], count: int) -> float:
+    """Returns how many objects ``build`` constructs per second."""
+    start = time.perf_counter()
+
+    for _ in range(count):
+        build()
+
+    return count / (time.perf_counter() - start)
+
+
+def bench_construction(report: Report, count: int) -> None:
+    client: Any = None  # The models only keep a reference to the client
+    anime, manga, episode = anime_resource(1), manga_resource(1), episode_resource(1, 1)
+
+    report.add("construct.anime", construction_rate(lambda: kitsu.Anime(anime, client), count), "obj/s", "higher")
+    report.add("construct.manga", construction_rate(lambda: kitsu.Manga(manga, client), count), "obj/s", "higher")
+    report.add("construct.episode", construction_rate(lambda: kitsu.Episode(episode), count), "obj/s", "higher")
+
+
+async def bench_client(report: Report, base_url: str, requests: int, concurrency: int, episode_count: int) -> None:
+    client = kitsu.Client(base_url=base_url)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_anime(anime_id: int) -> None:
+        async with semaphore:
+            await client.get_anime(anime_id)
+
+    try:
+        await client.get_anime(1)  # Open the connection pool before measuring
+
+        start = time.perf_counter()
+        await asyncio.gather(*(get_anime(i % 1000 + 1) for i in range(requests)))
+        report.add("client.get_anime", requests / (time.perf_counter() - start), "req/s", "higher")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client.search_anime(limit=20) for _ in range(requests // 20)))
+        report.add("client.search_anime", requests // 20 / (time.perf_counter() - start), "req/s", "higher")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client.trending_anime() for _ in range(requests // 10)))
+        report.add("client.trending_anime", requests // 10 / (time.perf_counter() - start), "req/s", "higher")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client.get_anime(1, includes=["episodes"]) for _ in range(requests // 100)))
+        report.add("client.get_anime_included", requests // 100 / (time.perf_counter() - start), "req/s", "higher")
+
+        anime = await client.get_anime(1)
+        start = time.perf_counter()
+        episodes = await anime.get_episodes()
+        report.add("client.get_episodes", (time.perf_counter() - start) * 1000, "ms", "lower")
+
+        if len(episodes or ()) != episode_count:
+            raise RuntimeError(f"get_episodes returned {len(episodes or ())} of {episode_count} episodes")
+    finally:
+        await client.close()
+
+
+def run(
+    *,
+    latency: float = 0.0,
+    requests: int = 2000,
+    concurrency: int = 50,
+    episode_count: int = 510,
+    construct_count: int = 20000,
+) -> Report:
+    """Runs the speed benchmarks against a stand-in server with the given latency."""
+    report = Report()
+    bench_construction(report, construct_count)
+
+    with serve_in_thread(latency=latency, episode_count=episode_count) as server:
+        asyncio.run(bench_client(report, server.url, requests, concurrency, episode_count))
+
+    return report
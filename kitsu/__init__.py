@@ -30,10 +30,22 @@ __copyright__ = "Copyright 2021-present MrArkon"
 
 import logging
 
+from .analytics import *
+from .cache import *
+from .categories import *
 from .client import *
 from .enums import *
 from .errors import *
+from .graphql import *
+from .mappings import *
+from .mirror import *
 from .models import *
+from .ratelimit import *
+from .recommend import *
+from .schedule import *
+from .search import *
+from .timings import *
+from .transport import *
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -0,0 +1,193 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Union
+
+from .models import Anime, Manga
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .mirror import Mirror
+
+__all__ = ("MediaFrame",)
+
+Media = Union[Anime, Manga]
+
+# Kitsu rates out of 20 in steps of 1, from 2 (1 star) to 20 (10 stars)
+RATINGS = tuple(range(2, 21))
+
+# Columns which may be missing, stored as floats with NaN for missing values
+FLOAT_COLUMNS = ("average_rating", "popularity_rank", "rating_rank", "episode_count", "chapter_count", "volume_count")
+INT_COLUMNS = ("id", "user_count", "favorites_count")
+
+_ATTRIBUTES = {
+    "average_rating": "averageRating",
+    "popularity_rank": "popularityRank",
+    "rating_rank": "ratingRank",
+    "episode_count": "episodeCount",
+    "chapter_count": "chapterCount",
+    "volume_count": "volumeCount",
+    "user_count": "userCount",
+    "favorites_count": "favoritesCount",
+}
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("MediaFrame requires numpy, install it with `pip install kitsu.py[analytics]`") from None
+
+    return numpy
+
+
+def _rating_column(rating: str) -> Optional[int]:
+    """Returns the column of a ``ratingFrequencies`` key in :data:`RATINGS`, if it is a rating Kitsu uses."""
+    column = int(rating) - RATINGS[0]
+    return column if 0 <= column < len(RATINGS) else None
+
+
+class MediaFrame:
+    """A columnar view over many anime or manga, backed by contiguous NumPy arrays.
+
+    Every column is a :class:`numpy.ndarray` with one value per media, and can be
+    used with any NumPy function. Counts and ids are integers, while ratings, ranks
+    and episode, chapter and volume counts are floats with ``NaN`` where the API
+    returned no value. Rating frequencies are an integer matrix with one row per
+    media and one column per rating in :data:`RATINGS`.
+
+    This requires `numpy <https://numpy.org>`_ to be installed.
+
+    Parameters
+    ----------
+    columns: Dict[:class:`str`, :class:`numpy.ndarray`]
+        The columns of the frame, all of the same length.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        self.columns = columns
+
+    def __repr__(self) -> str:
+        return f"<kitsu.MediaFrame rows={len(self)} columns={len(self.columns)}>"
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @classmethod
+    def from_resources(cls, resources: Iterable[Mapping[str, Any]]) -> MediaFrame:
+        """Builds a frame straight from raw anime or manga resources, without constructing models."""
+        numpy = _numpy()
+        resources = list(resources)
+        columns: Dict[str, Any] = {}
+
+        for name in INT_COLUMNS:
+            if name == "id":
+                values: List[Any] = [int(resource["id"]) for resource in resources]
+            else:
+                values = [resource["attributes"].get(_ATTRIBUTES[name]) or 0 for resource in resources]
+
+            columns[name] = numpy.array(values, dtype=numpy.int64)
+
+        for name in FLOAT_COLUMNS:
+            key = _ATTRIBUTES[name]
+            values = [resource["attributes"].get(key) for resource in resources]
+            columns[name] = numpy.array([numpy.nan if value is None else float(value) for value in values], dtype=float)
+
+        frequencies = numpy.zeros((len(resources), len(RATINGS)), dtype=numpy.int64)
+
+        for row, resource in enumerate(resources):
+            for rating, count in (resource["attributes"].get("ratingFrequencies") or {}).items():
+                if (column := _rating_column(rating)) is not None:
+                    frequencies[row, column] = int(count)
+
+        columns["rating_frequencies"] = frequencies
+        return cls(columns)
+
+    @classmethod
+    def from_media(cls, media: Iterable[Media]) -> MediaFrame:
+        """Builds a frame from :class:`Anime` or :class:`Manga` models."""
+        return cls.from_resources(item._data for item in media)
+
+    @classmethod
+    def from_mirror(cls, mirror: Mirror, kind: Literal["anime", "manga"]) -> MediaFrame:
+        """Builds a frame from the anime or manga in a :class:`Mirror`."""
+        return cls.from_resources(mirror.resources(kind))
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> MediaFrame:
+        """Returns a frame with the rows at ``indices``, in that order."""
+        return MediaFrame({name: column[indices] for name, column in self.columns.items()})
+
+    def filter(self, mask: np.ndarray) -> MediaFrame:
+        """Returns a frame with the rows where the boolean ``mask`` is true.
+
+        Example: ``frame.filter(frame["user_count"] > 1000)``.
+        """
+        return MediaFrame({name: column[mask] for name, column in self.columns.items()})
+
+    def sort(self, column: str, *, descending: bool = False) -> MediaFrame:
+        """Returns a frame sorted by ``column``, with ``NaN`` values last."""
+        numpy = _numpy()
+        values = self.columns[column]
+        order = numpy.argsort(-values if descending else values, kind="stable")
+        return self.take(order)
+
+    def top(self, column: str, count: int = 10) -> MediaFrame:
+        """Returns the ``count`` rows with the highest values of ``column``."""
+        numpy = _numpy()
+        values = numpy.nan_to_num(self.columns[column].astype(float), nan=-numpy.inf)
+
+        if count < len(values):
+            indices = numpy.argpartition(-values, count)[:count]
+        else:
+            indices = numpy.arange(len(values))
+
+        return self.take(indices[numpy.argsort(-values[indices], kind="stable")])
+
+    def aggregate(self, column: str, how: Literal["sum", "mean", "min", "max", "median", "std"] = "mean") -> float:
+        """Aggregates a column, ignoring ``NaN`` values."""
+        numpy = _numpy()
+        return float(getattr(numpy, f"nan{how}")(self.columns[column]))
+
+    def rating_histogram(self) -> np.ndarray:
+        """Returns the summed rating frequencies of every row, one value per rating in :data:`RATINGS`."""
+        return self.columns["rating_frequencies"].sum(axis=0)
+
+    def mean_ratings(self) -> np.ndarray:
+        """Returns each row's mean rating out of 100, computed from its rating frequencies."""
+        numpy = _numpy()
+        frequencies = self.columns["rating_frequencies"]
+        totals = frequencies.sum(axis=1)
+        weighted = frequencies @ numpy.array(RATINGS, dtype=float)
+
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return numpy.where(totals > 0, weighted / totals * 5, numpy.nan)
+
+    def ids(self) -> List[int]:
+        """Returns the ids of the rows, in order."""
+        return self.columns["id"].tolist()
@@ -0,0 +1,329 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from time import time
+from typing import Optional, Tuple
+
+__all__ = ("Cache", "MemoryCache", "FileCache", "ImageCache")
+
+
+class Cache:
+    """The base class for the response caches used by :class:`Client`.
+
+    Values are the raw bodies of successful responses, keyed by the method,
+    path and query of the request. Subclasses implement :meth:`get` and :meth:`set`.
+
+    Parameters
+    ----------
+    ttl: :class:`float`, default: 300.0
+        The number of seconds a response is cached for, unless given when it is set.
+    """
+
+    def __init__(self, *, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value of ``key``, or ``None`` if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Caches ``value`` under ``key`` for ``ttl`` seconds, defaulting to the cache's ``ttl``."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Removes ``key`` from the cache if it is present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Removes every value from the cache."""
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """A size bounded in-memory cache, evicting the least recently used values first.
+
+    Parameters
+    ----------
+    ttl: :class:`float`, default: 300.0
+        The number of seconds a response is cached for, unless given when it is set.
+    max_size: :class:`int`, default: 1024
+        The maximum number of values kept.
+    """
+
+    def __init__(self, *, ttl: float = 300.0, max_size: int = 1024) -> None:
+        super().__init__(ttl=ttl)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<kitsu.MemoryCache ttl={self.ttl} size={len(self._entries)}/{self.max_size}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires, value = entry
+
+        if expires <= time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileCache(Cache):
+    """A cache stored as files in a directory, which can be shared by every process on a host.
+
+    Each value is written to a temporary file and atomically renamed into place,
+    so concurrent readers in other processes never see a partial value. When the
+    directory holds more than ``max_entries`` values the least recently written
+    ones are removed.
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory to store the values in, it is created if it does not exist.
+    ttl: :class:`float`, default: 300.0
+        The number of seconds a response is cached for, unless given when it is set.
+    max_entries: :class:`int`, default: 10000
+        The maximum number of values kept.
+    """
+
+    _HEADER = struct.Struct("<d")
+    _PRUNE_INTERVAL = 100
+
+    def __init__(self, directory: str, *, ttl: float = 300.0, max_entries: int = 10000) -> None:
+        super().__init__(ttl=ttl)
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<kitsu.FileCache directory={self.directory} ttl={self.ttl}>"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as file:
+                payload = file.read()
+        except FileNotFoundError:
+            return None
+
+        (expires,) = self._HEADER.unpack_from(payload)
+
+        if expires <= time():
+            return None
+
+        return payload[self._HEADER.size :]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        header = self._HEADER.pack(time() + (self.ttl if ttl is None else ttl))
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(header + value)
+
+        os.replace(temporary, self._path(key))
+
+        self._writes += 1
+        if self._writes % self._PRUNE_INTERVAL == 0:
+            self._prune()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _prune(self) -> None:
+        entries = []
+
+        for entry in os.scandir(self.directory):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class ImageCache:
+    """A content-addressed cache of image files, bounded by their total size.
+
+    Each image is stored once under the SHA-256 digest of its content, however
+    many URLs point to it, and every URL keeps a small reference to its digest.
+    The total size is checked every 20 writes, and when the images take more than
+    ``max_bytes`` the least recently used ones are removed. Files are renamed into
+    place so the directory can be shared by every process on a host.
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory to store the images in, it is created if it does not exist.
+    max_bytes: :class:`int`, default: 268435456
+        The maximum total size of the stored images in bytes.
+    """
+
+    _PRUNE_INTERVAL = 20
+
+    def __init__(self, directory: str, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._writes = 0
+
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "urls"), exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<kitsu.ImageCache directory={self.directory} max_bytes={self.max_bytes}>"
+
+    def _blob(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest)
+
+    def _reference(self, url: str) -> str:
+        return os.path.join(self.directory, "urls", hashlib.sha256(url.encode()).hexdigest())
+
+    def _write(self, path: str, value: bytes) -> None:
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(value)
+
+        os.replace(temporary, path)
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Returns the image stored for ``url``, or ``None`` if it is missing or was removed."""
+        try:
+            with open(self._reference(url), "rb") as file:
+                blob = self._blob(file.read().decode())
+
+            with open(blob, "rb") as file:
+                value = file.read()
+        except FileNotFoundError:
+            return None
+
+        # The modification time orders the images by their last use when pruning
+        try:
+            os.utime(blob)
+        except FileNotFoundError:
+            pass
+
+        return value
+
+    def set(self, url: str, value: bytes) -> str:
+        """Stores the image for ``url`` and returns the digest it is stored under."""
+        digest = hashlib.sha256(value).hexdigest()
+
+        if os.path.exists(blob := self._blob(digest)):
+            os.utime(blob)
+        else:
+            self._write(blob, value)
+
+        self._write(self._reference(url), digest.encode())
+
+        self._writes += 1
+        if self._writes % self._PRUNE_INTERVAL == 0:
+            self._prune()
+
+        return digest
+
+    def clear(self) -> None:
+        """Removes every stored image."""
+        for folder in ("blobs", "urls"):
+            for entry in os.scandir(os.path.join(self.directory, folder)):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def _prune(self) -> None:
+        entries = []
+
+        for entry in os.scandir(os.path.join(self.directory, "blobs")):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+
+        if total <= self.max_bytes:
+            return
+
+        # References to removed images are left behind, they read as missing
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total -= size
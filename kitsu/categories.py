@@ -0,0 +1,196 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .cache import MemoryCache
+from .models import Anime, Category, Manga
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = ("CategoryRegistry",)
+
+_log = logging.getLogger(__name__)
+
+
+class CategoryRegistry:
+    """The full table of Kitsu categories, loaded once and resolved locally.
+
+    Categories are a small set that rarely changes, so the whole table is requested
+    with its pages fetched concurrently, kept in memory and optionally saved to disk.
+    The relationships of a media then only need the ids of its categories.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to request the categories with.
+    path: Optional[:class:`str`]
+        The path of a JSON file the table is saved to, and loaded from while it is fresh.
+    ttl: :class:`float`, default: 604800.0
+        The number of seconds the table is used for before it is requested again.
+    """
+
+    def __init__(self, client: Client, *, path: Optional[str] = None, ttl: float = 604800.0) -> None:
+        self.client = client
+        self.path = path
+        self.ttl = ttl
+        self._categories: Dict[int, Category] = {}
+        self._slugs: Dict[str, Category] = {}
+        self._titles: Dict[str, Category] = {}
+        self._loaded_at: Optional[float] = None
+        self._media = MemoryCache(ttl=ttl, max_size=4096)
+        self._lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<kitsu.CategoryRegistry size={len(self._categories)}>"
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __iter__(self) -> Iterator[Category]:
+        return iter(list(self._categories.values()))
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the table is loaded and younger than ``ttl``."""
+        return self._loaded_at is not None and time() - self._loaded_at < self.ttl
+
+    def _index(self, resources: Iterable[Dict[str, Any]], loaded_at: float) -> None:
+        categories = [Category(resource) for resource in resources]  # type: ignore
+
+        self._categories = {category.id: category for category in categories}
+        self._slugs = {category.slug: category for category in categories}
+        self._titles = {category.title.casefold(): category for category in categories}
+        self._loaded_at = loaded_at
+
+    def _read(self) -> bool:
+        if self.path is None or not os.path.exists(self.path):
+            return False
+
+        with open(self.path, encoding="utf-8") as file:
+            payload = json.load(file)
+
+        if time() - payload["loaded_at"] >= self.ttl:
+            return False
+
+        self._index(payload["data"], payload["loaded_at"])
+        return True
+
+    def _write(self) -> None:
+        temporary = f"{self.path}.tmp"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            payload = {"loaded_at": self._loaded_at, "data": [category._data for category in self._categories.values()]}
+            json.dump(payload, file, ensure_ascii=False, separators=(",", ":"))
+
+        os.replace(temporary, self.path)  # type: ignore
+
+    async def load(self, *, concurrency: int = 4, force: bool = False) -> None:
+        """Loads the table, unless it is already fresh in memory or on disk.
+
+        The first page gives the number of categories, the remaining pages are
+        then requested with at most ``concurrency`` requests in flight.
+
+        Parameters
+        ----------
+        concurrency: :class:`int`, default: 4
+            The maximum number of pages requested at once.
+        force: :class:`bool`, default: False
+            Whether to request the table even if it is fresh.
+        """
+        async with self._lock:
+            if not force and (self.fresh or self._read()):
+                return
+
+            params = {"page[limit]": "20", "sort": "id"}
+            first = await self.client._request("categories", params={**params, "page[offset]": "0"})
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+            async def page(offset: int) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    data = await self.client._request("categories", params={**params, "page[offset]": str(offset)})
+                    return data["data"]
+
+            offsets = range(len(first["data"]), first["meta"]["count"], 20)
+            pages = await asyncio.gather(*(page(offset) for offset in offsets))
+
+            self._index([item for items in (first["data"], *pages) for item in items], time())
+            self._media.clear()
+            _log.debug("Loaded %s categories", len(self._categories))
+
+            if self.path is not None:
+                self._write()
+
+    def get(self, category_id: int) -> Optional[Category]:
+        """Returns the category with the given id, if it is in the table."""
+        return self._categories.get(int(category_id))
+
+    def get_slug(self, slug: str) -> Optional[Category]:
+        """Returns the category with the given slug, if it is in the table."""
+        return self._slugs.get(slug)
+
+    def find(self, title: str) -> Optional[Category]:
+        """Returns the category with the given title, ignoring case, if it is in the table."""
+        return self._titles.get(title.casefold())
+
+    def resolve(self, category_ids: Iterable[Union[int, str]]) -> List[Category]:
+        """Returns the categories with the given ids, skipping those missing from the table."""
+        return [category for category_id in category_ids if (category := self.get(int(category_id))) is not None]
+
+    def parents(self, category: Category) -> List[Category]:
+        """Returns the ancestors of a category, nearest first."""
+        parents = []
+
+        while category.parent_id is not None and (category := self.get(category.parent_id)) is not None:  # type: ignore
+            parents.append(category)
+
+        return parents
+
+    async def categories_of(self, media: Union[Anime, Manga]) -> List[Category]:
+        """Returns the categories of an Anime or Manga.
+
+        Only the ids of the categories are requested, unless the media was fetched
+        with its category relationship, and they are kept for ``ttl`` seconds.
+        """
+        await self.load()
+
+        kind = "anime" if isinstance(media, Anime) else "manga"
+        key = f"{kind}/{media.id}"
+
+        if (linkage := media._data.get("relationships", {}).get("categories", {}).get("data")) is not None:
+            return self.resolve(item["id"] for item in linkage)
+
+        if (cached := self._media.get(key)) is None:
+            data = await self.client._request(f"{kind}/{media.id}/relationships/categories")
+            cached = json.dumps([item["id"] for item in data["data"]]).encode()
+            self._media.set(key, cached)
+
+        return self.resolve(json.loads(cached))
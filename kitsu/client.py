@@ -23,21 +23,60 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Literal, Optional
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import random
+from collections import deque
+from time import monotonic, perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
+from yarl import URL
 
 from . import __version__
+from .cache import Cache, ImageCache, MemoryCache
 from .enums import AgeRating, Season
-from .errors import BadRequest, HTTPException, NotFound
-from .models import Anime, Manga
+from .errors import BadRequest, GraphQLError, HTTPException, NotFound
+from .graphql import ANIME_DETAILS, MANGA_DETAILS, MediaDetails
+from .mappings import _MISSING, MappingTable
+from .models import Anime, Category, Chapter, Episode, Image, Manga
+from .ratelimit import RateLimiter
+from .timings import RequestTimings, build_timer
+from .transport import HTTPTransport, Response, Transport, _request_key
 
 if TYPE_CHECKING:
     from .types import AnimeCollection, AnimeResource, MangaCollection, MangaResource
 
 __all__ = ("Client",)
 
+_log = logging.getLogger(__name__)
+
 BASE = "https://kitsu.io/api/edge"
+SLUG_TTL = 30 * 24 * 60 * 60
+SLUG_INDEX_SIZE = 65536
+PAGE_SIZE = 20
+
+T = TypeVar("T")
 HEADERS = {
     "Accept": "application/vnd.api+json",
     "Content-Type": "application/vnd.api+json",
@@ -45,6 +84,19 @@ HEADERS = {
 }
 
 
+def _page_offsets(page: Dict[str, Any]) -> range:
+    """Returns the offsets of the pages after the first of a collection, read from its count or last page link."""
+    if (count := (page.get("meta") or {}).get("count")) is not None:
+        end = count
+    elif (last := page["links"].get("last")) is not None:
+        # The last link starts a full page before the end, it is not aligned to the other pages
+        end = int(URL(last).query.get("page[offset]", 0)) + PAGE_SIZE
+    else:
+        end = 0
+
+    return range(PAGE_SIZE, end, PAGE_SIZE)
+
+
 class Client:
     """Represents the client used to interface with the Kitsu API.
 
@@ -52,34 +104,306 @@ class Client:
     ----------
     session: Optional[:class:`aiohttp.ClientSession`]
         The aiohttp client session to use for performing requests to the Kitsu API.
+        DNS and connect timings are only recorded when the client creates its own session.
+    transport: Optional[:class:`Transport`]
+        The transport to perform requests with, such as a :class:`RecordingTransport`
+        or :class:`ReplayTransport`. Defaults to a :class:`HTTPTransport` over ``session``.
+    timing_hook: Optional[Callable[[:class:`RequestTimings`], Any]]
+        A callable invoked with the timings of each sampled request, see :meth:`enable_timings`.
+    timing_sample_rate: :class:`float`, default: 0.0
+        The fraction of requests to record timings for, between 0 and 1.
+    base_url: :class:`str`
+        The base URL of the Kitsu API, this can be pointed at a mirror or a local stand-in server.
+    rate_limiter: Optional[:class:`RateLimiter`]
+        The rate limiter every request waits on before it is performed. A :class:`SharedRateLimiter`
+        enforces one limit across every process on the host.
+    cache: Optional[:class:`Cache`]
+        The cache for successful ``GET`` responses. A :class:`FileCache` shares
+        cached responses between every process on the host.
+    mappings: Optional[:class:`MappingTable`]
+        The table external ids are resolved from, see :meth:`resolve_mappings`.
+        It can be shared between clients or preloaded with :meth:`MappingTable.load_mirror`.
+    not_found_cache: Optional[:class:`Cache`]
+        The cache ``404`` responses are kept in per resource path, so repeated lookups of
+        missing ids raise :exc:`NotFound` without a request. Defaults to a :class:`MemoryCache`
+        holding up to 4096 paths for 60 seconds.
+    image_cache: Optional[:class:`ImageCache`]
+        The cache images downloaded with :meth:`fetch_image` and :meth:`fetch_images` are kept in.
+    graphql_url: Optional[:class:`str`]
+        The URL of the GraphQL API, defaults to ``graphql`` next to ``base_url``.
     """
 
-    __slots__ = ("_session",)
+    __slots__ = (
+        "_transport",
+        "_base",
+        "_rate_limiter",
+        "_cache",
+        "_not_found",
+        "_images",
+        "_graphql_url",
+        "_persisted_queries",
+        "_timing_hook",
+        "_timing_sample_rate",
+        "_edges",
+        "_mappings",
+        "_slugs",
+        "_stale_after",
+        "_refresh_interval",
+        "_hot",
+        "_revalidating",
+        "_refresher",
+    )
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
-        self._session = session or aiohttp.ClientSession()
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        transport: Optional[Transport] = None,
+        timing_hook: Optional[Callable[[RequestTimings], Any]] = None,
+        timing_sample_rate: float = 0.0,
+        base_url: str = BASE,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[Cache] = None,
+        mappings: Optional[MappingTable] = None,
+        not_found_cache: Optional[Cache] = None,
+        image_cache: Optional[ImageCache] = None,
+        graphql_url: Optional[str] = None,
+    ) -> None:
+        self._transport = transport or HTTPTransport(session)
+        self._base = base_url.rstrip("/")
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._images = image_cache
+        self._graphql_url = graphql_url or f"{self._base.rsplit('/', 1)[0]}/graphql"
+        self._persisted_queries = True
+        self._not_found = not_found_cache if not_found_cache is not None else MemoryCache(ttl=60.0, max_size=4096)
+        self._timing_hook = timing_hook
+        self._timing_sample_rate = timing_sample_rate
+        self._edges = MemoryCache(ttl=3600.0, max_size=4096)
+        self._mappings = mappings if mappings is not None else MappingTable()
+        self._slugs = MemoryCache(ttl=SLUG_TTL, max_size=SLUG_INDEX_SIZE)
+        self._stale_after: Optional[float] = None
+        self._refresh_interval: Optional[float] = None
+        self._hot: Dict[str, Tuple[float, Any]] = {}
+        self._revalidating: Dict[str, asyncio.Task] = {}
+        self._refresher: Optional[asyncio.Task] = None
 
     def __repr__(self) -> str:
         return "<kitsu.Client>"
 
+    @property
+    def mappings(self) -> MappingTable:
+        """The table external ids are resolved from."""
+        return self._mappings
+
+    def enable_timings(self, hook: Optional[Callable[[RequestTimings], Any]] = None, *, sample_rate: float = 1.0) -> None:
+        """Starts recording per-stage timings for a sample of the requests.
+
+        Each sampled request is logged on the ``kitsu.timings`` logger at ``DEBUG`` level
+        with the timings under the ``kitsu_timings`` record attribute, and passed to ``hook``.
+
+        Parameters
+        ----------
+        hook: Optional[Callable[[:class:`RequestTimings`], Any]]
+            A callable invoked with the timings of each sampled request.
+        sample_rate: :class:`float`, default: 1.0
+            The fraction of requests to record timings for, between 0 and 1.
+        """
+        self._timing_hook = hook
+        self._timing_sample_rate = max(min(sample_rate, 1.0), 0.0)
+
+    def disable_timings(self) -> None:
+        """Stops recording per-stage timings."""
+        self._timing_hook = None
+        self._timing_sample_rate = 0.0
+
+    def enable_revalidation(self, stale_after: float = 60.0, *, refresh_interval: Optional[float] = None) -> None:
+        """Serves the trending endpoints in stale-while-revalidate mode.
+
+        Once a result has been fetched it is returned instantly. When it is older than
+        ``stale_after`` seconds it is still returned, while a background task fetches
+        the next one. Only the first call of each endpoint waits on the network.
+
+        Parameters
+        ----------
+        stale_after: :class:`float`, default: 60.0
+            The number of seconds after which a result is refreshed in the background.
+        refresh_interval: Optional[:class:`float`]
+            If given, every result is also refreshed periodically, so it is rarely stale when it is read.
+        """
+        self.disable_revalidation()
+        self._stale_after = stale_after
+        self._refresh_interval = refresh_interval
+
+    def disable_revalidation(self) -> None:
+        """Stops serving the trending endpoints in stale-while-revalidate mode and drops the kept results."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+        for task in self._revalidating.values():
+            task.cancel()
+
+        self._revalidating.clear()
+        self._hot.clear()
+        self._stale_after = None
+        self._refresh_interval = None
+
+    async def _revalidate(self, path: str) -> Any:
+        """Internal function used to fetch the next result of a hot endpoint."""
+        try:
+            data = await self._request(path)
+        except Exception:
+            _log.warning("Failed to revalidate %s", path, exc_info=True)
+            raise
+        finally:
+            self._revalidating.pop(path, None)
+
+        self._hot[path] = (monotonic(), data)
+        return data
+
+    async def _refresh_periodically(self) -> None:
+        """Internal function used to refresh every hot endpoint on an interval."""
+        while self._refresh_interval is not None:
+            await asyncio.sleep(self._refresh_interval)
+
+            for path in list(self._hot):
+                if path not in self._revalidating:
+                    self._revalidating[path] = asyncio.create_task(self._revalidate(path))
+
+            await asyncio.gather(*self._revalidating.values(), return_exceptions=True)
+
+    async def _request_hot(self, path: str) -> Any:
+        """Internal function used to request an endpoint which may be served stale while it is revalidated."""
+        if self._stale_after is None:
+            return await self._request(path)
+
+        if self._refresh_interval is not None and self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_periodically())
+
+        if (entry := self._hot.get(path)) is None:
+            if (task := self._revalidating.get(path)) is None:
+                task = self._revalidating[path] = asyncio.create_task(self._revalidate(path))
+
+            return await asyncio.shield(task)
+
+        fetched_at, data = entry
+
+        if monotonic() - fetched_at >= self._stale_after and path not in self._revalidating:
+            task = self._revalidating[path] = asyncio.create_task(self._revalidate(path))
+            # Nobody awaits this task, retrieve its exception so it is only reported by the log above
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+        return data
+
+    def _build_timer(self, model: str) -> ContextManager[None]:
+        """Internal function used to time the construction of models for a sample of the calls."""
+        return build_timer(model, self._timing_hook, self._timing_sample_rate)
+
+    async def _fetch(
+        self, method: str, url: str, params: Optional[Dict[str, Any]] = None, timings: Optional[RequestTimings] = None
+    ) -> Response:
+        """Internal function used to perform a request through the cache, rate limiter and transport."""
+        key = None
+        if method == "GET":
+            # A missing resource is missing whatever the query, so 404s are kept per path
+            if (body := self._not_found.get(_request_key(method, url, None))) is not None:
+                return Response(404, body)
+
+            if self._cache is not None:
+                key = _request_key(method, url, params)
+
+                if (body := self._cache.get(key)) is not None:
+                    return Response(200, body)
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        if timings is not None:
+            timings._start = perf_counter()
+
+        response = await self._transport.request(method, url, params=params, headers=HEADERS, timings=timings)
+
+        if key is not None and response.status == 200:
+            self._cache.set(key, response.body)
+        elif method == "GET" and response.status == 404:
+            self._not_found.set(_request_key(method, url, None), response.body)
+
+        return response
+
     async def _request(self, path: str = "", method: str = "GET", **kwargs: Any) -> Any:
         """Internal function used to perform requests to the Kitsu API."""
-        kwargs["headers"] = HEADERS
+        url = kwargs.pop("url", f"{self._base}/{path}")
+
+        timings = None
+        if self._timing_sample_rate and random.random() < self._timing_sample_rate:
+            timings = RequestTimings(method, url, self._timing_hook)
 
-        url = kwargs.pop("url", f"{BASE}/{path}")
+        response = await self._fetch(method, url, kwargs.get("params"), timings)
 
-        async with self._session.request(method=method, url=url, **kwargs) as response:
-            data = await response.json()
+        start = perf_counter()
 
+        try:
+            data = json.loads(response.body)
+        except ValueError:
+            # Gateways in front of the API answer some errors with HTML pages
             if response.status == 200:
-                return data
+                raise
+
+            data = None
+
+        if timings is not None:
+            timings.decode = perf_counter() - start
+            timings._dispatch()
+
+        if response.status == 200:
+            self._index_slugs(data)
+            return data
+
+        raw = response.raw if response.raw is not None else response
+        errors = data.get("errors") if isinstance(data, dict) else None
+
+        if response.status == 400 and errors:
+            raise BadRequest(raw, errors[0]["detail"])
+        elif response.status == 404 and errors:
+            raise NotFound(raw, errors[0]["detail"])
+        else:
+            raise HTTPException(raw, response.body.decode(errors="replace"), response.status)
+
+    def _index_slugs(self, data: Any) -> None:
+        """Internal function used to record the slug of every anime and manga seen in a response."""
+        if not isinstance(data, dict):
+            return
+
+        resources = data.get("data")
+        resources = resources if isinstance(resources, list) else [resources] if resources else []
+
+        for item in itertools.chain(resources, data.get("included") or ()):
+            if item.get("type") in ("anime", "manga") and (slug := item.get("attributes", {}).get("slug")):
+                self._slugs.set(f"{item['type']}/{slug}", str(item["id"]).encode())
+
+    async def _resolve_slug(self, kind: str, slug: str, params: Dict[str, Any]) -> Tuple[Optional[int], Any]:
+        """Internal function used to find the id of a slug, from the index or with a ``filter[slug]`` request."""
+        key = f"slugs/{kind}/{slug}"
+
+        if (cached := self._slugs.get(f"{kind}/{slug}")) is not None:
+            return int(cached), None
+
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            self._slugs.set(f"{kind}/{slug}", cached)
+            return int(cached), None
 
-            if response.status == 400:
-                raise BadRequest(response, data["errors"][0]["detail"])
-            elif response.status == 404:
-                raise NotFound(response, data["errors"][0]["detail"])
-            else:
-                raise HTTPException(response, await response.text(), response.status)
+        data = await self._request(kind, params={**params, "filter[slug]": slug})
+
+        if not data["data"]:
+            return None, None
+
+        media_id = int(data["data"][0]["id"])
+
+        if self._cache is not None:
+            self._cache.set(key, str(media_id).encode(), SLUG_TTL)
+
+        return media_id, data
 
     async def get_anime(self, anime_id: int, *, includes: Optional[List[Literal["episodes"]]] = None) -> Anime:
         """
@@ -102,7 +426,42 @@ class Client:
             params["include"] = ",".join(includes)
 
         data: AnimeResource = await self._request(f"anime/{anime_id}", params=params)
-        return Anime(data["data"], self, included=data.get("included"))
+
+        with self._build_timer("Anime"):
+            return Anime(data["data"], self, included=data.get("included"))
+
+    async def get_anime_by_slug(self, slug: str, *, includes: Optional[List[Literal["episodes"]]] = None) -> Optional[Anime]:
+        """
+        Fetches an Anime from the Kitsu API by its slug.
+
+        The slugs of the anime and manga the client receives are kept in a bounded
+        in-memory index, so a recently seen slug is fetched by its id. Slugs looked up
+        with a ``filter[slug]`` request are also stored in the ``cache``, so a persistent
+        cache keeps them across clients.
+
+        Parameters
+        ----------
+        slug: :class:`str`
+            The slug of the Anime on Kitsu, as in its :attr:`Anime.url`.
+        includes: List[Literal["episodes"]]
+            The list of options to include extra information with the Anime.
+
+        Returns
+        -------
+        Optional[:class:`Anime`]
+            The Anime, or ``None`` if no Anime has this slug.
+        """
+        params = {"include": ",".join(includes)} if includes else {}
+        anime_id, data = await self._resolve_slug("anime", slug, params)
+
+        if anime_id is None:
+            return None
+
+        if data is None:
+            return await self.get_anime(anime_id, includes=includes)
+
+        with self._build_timer("Anime"):
+            return Anime(data["data"][0], self, included=data.get("included"))
 
     async def search_anime(
         self,
@@ -113,7 +472,7 @@ class Client:
         before_year: Optional[int] = None,
         season: Optional[List[Season]] = None,
         age_rating: Optional[List[AgeRating]] = None,
-        categories: Optional[List[str]] = None,
+        categories: Optional[List[Union[str, Category]]] = None,
     ) -> List[Anime]:
         """
         Searches for Animes from the Kitsu API.
@@ -134,8 +493,9 @@ class Client:
             The release season(s) of the Anime to use for filtering the results.
         age_rating: Optional[List[:class:`AgeRating`]]
             The age rating(s) of the Anime to use for filtering the results.
-        categories: Optional[List[:class:`str`]]
-            The categories of the Anime to use for filtering the results.
+        categories: Optional[List[Union[:class:`str`, :class:`Category`]]]
+            The categories of the Anime to use for filtering the results, as slugs or
+            :class:`Category` objects from a :class:`CategoryRegistry`.
 
         Returns
         -------
@@ -156,21 +516,221 @@ class Client:
             params["filter[ageRating]"] = ",".join(str(i) for i in age_rating)
 
         if categories is not None:
-            params["filter[categories]"] = ",".join(categories)
+            params["filter[categories]"] = ",".join(
+                category.slug if isinstance(category, Category) else category for category in categories
+            )
 
         data: AnimeCollection = await self._request("anime", params=params)
-        return [Anime(payload, self) for payload in data["data"]]
+
+        with self._build_timer("Anime"):
+            return [Anime(payload, self) for payload in data["data"]]
+
+    async def _paginate(self, path: str, semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict[str, Any]]:
+        """Internal function used to fetch every resource of a collection, requesting the pages after the first concurrently."""
+        semaphore = semaphore or asyncio.Semaphore(8)
+
+        async def page(offset: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                data = await self._request(path, params={"page[limit]": str(PAGE_SIZE), "page[offset]": str(offset)})
+                return data["data"]
+
+        async with semaphore:
+            first = await self._request(path, params={"page[limit]": str(PAGE_SIZE)})
+
+        pages = await asyncio.gather(*(page(offset) for offset in _page_offsets(first)))
+        return list(itertools.chain(first["data"], *pages))
+
+    async def _stream(self, path: str, read_ahead: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Internal function used to yield the pages of a collection in order, requesting up to ``read_ahead`` ahead."""
+        first = await self._request(path, params={"page[limit]": str(PAGE_SIZE)})
+        offsets = iter(_page_offsets(first))
+        pending: Deque[asyncio.Task] = deque()
+
+        def request_ahead() -> None:
+            while len(pending) < max(read_ahead, 1) and (offset := next(offsets, None)) is not None:
+                params = {"page[limit]": str(PAGE_SIZE), "page[offset]": str(offset)}
+                pending.append(asyncio.create_task(self._request(path, params=params)))
+
+        try:
+            page = first
+
+            while True:
+                if read_ahead:
+                    request_ahead()
+
+                yield page["data"]
+
+                if not read_ahead:
+                    request_ahead()
+
+                if not pending:
+                    break
+
+                page = await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _each(
+        self, ids: List[int], fetch: Callable[[int, asyncio.Semaphore], Awaitable[T]], concurrency: int
+    ) -> AsyncIterator[Tuple[int, T]]:
+        """Internal function used to run ``fetch`` for many ids on one pool, yielding the results as they complete."""
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(item_id: int) -> Tuple[int, T]:
+            return item_id, await fetch(item_id, semaphore)
+
+        tasks = [asyncio.create_task(run(item_id)) for item_id in dict.fromkeys(ids)]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _episodes(self, anime_id: int, semaphore: Optional[asyncio.Semaphore] = None) -> List[Episode]:
+        """Internal function used to fetch every episode of an anime."""
+        payloads = await self._paginate(f"anime/{anime_id}/episodes", semaphore)
+
+        with self._build_timer("Episode"):
+            return [Episode(payload) for payload in payloads]  # type: ignore
+
+    async def _chapters(self, manga_id: int, semaphore: Optional[asyncio.Semaphore] = None) -> List[Chapter]:
+        """Internal function used to fetch every chapter of a manga."""
+        payloads = await self._paginate(f"manga/{manga_id}/chapters", semaphore)
+
+        with self._build_timer("Chapter"):
+            return [Chapter(payload) for payload in payloads]  # type: ignore
+
+    async def iter_episodes(self, anime_id: int, *, read_ahead: int = 1) -> AsyncIterator[Episode]:
+        """
+        Streams the episodes of an Anime, yielding them as their pages arrive.
+
+        Unlike :meth:`Anime.get_episodes` the episodes are not cached, only the page
+        being consumed and up to ``read_ahead`` pages requested ahead of it are held.
+
+        Parameters
+        ----------
+        anime_id: :class:`int`
+            The UUID of the Anime on Kitsu.
+        read_ahead: :class:`int`, default: 1
+            The number of pages requested while the current one is consumed, ``0`` requests one page at a time.
+
+        Yields
+        ------
+        :class:`Episode`
+        """
+        async for page in self._stream(f"anime/{anime_id}/episodes", read_ahead):
+            with self._build_timer("Episode"):
+                episodes = [Episode(payload) for payload in page]  # type: ignore
+
+            for episode in episodes:
+                yield episode
+
+    async def iter_chapters(self, manga_id: int, *, read_ahead: int = 1) -> AsyncIterator[Chapter]:
+        """
+        Streams the chapters of a Manga, yielding them as their pages arrive.
+
+        Unlike :meth:`Manga.get_chapters` the chapters are not cached, only the page
+        being consumed and up to ``read_ahead`` pages requested ahead of it are held.
+
+        Parameters
+        ----------
+        manga_id: :class:`int`
+            The UUID of the Manga on Kitsu.
+        read_ahead: :class:`int`, default: 1
+            The number of pages requested while the current one is consumed, ``0`` requests one page at a time.
+
+        Yields
+        ------
+        :class:`Chapter`
+        """
+        async for page in self._stream(f"manga/{manga_id}/chapters", read_ahead):
+            with self._build_timer("Chapter"):
+                chapters = [Chapter(payload) for payload in page]  # type: ignore
+
+            for chapter in chapters:
+                yield chapter
+
+    async def get_episodes(
+        self, anime: Iterable[Union[Anime, int]], *, concurrency: int = 8
+    ) -> AsyncIterator[Tuple[int, List[Episode]]]:
+        """
+        Fetches the episodes of many Animes, yielding the episodes of each Anime as soon as they are all fetched.
+
+        The pages of every Anime are requested from one pool with at most ``concurrency``
+        requests in flight. The episodes are also cached on the given :class:`Anime` models,
+        as with :meth:`Anime.get_episodes`.
+
+        Parameters
+        ----------
+        anime: Iterable[Union[:class:`Anime`, :class:`int`]]
+            The Animes, or their UUIDs on Kitsu.
+        concurrency: :class:`int`, default: 8
+            The maximum number of requests in flight at once.
+
+        Yields
+        ------
+        Tuple[:class:`int`, List[:class:`Episode`]]
+            The UUID of an Anime and its episodes, in the order the Animes complete.
+        """
+        anime = list(anime)
+        models = {item.id: item for item in anime if isinstance(item, Anime)}
+        ids = [item.id if isinstance(item, Anime) else int(item) for item in anime]
+
+        async for anime_id, episodes in self._each(ids, self._episodes, concurrency):
+            if (model := models.get(anime_id)) is not None:
+                model.episodes = episodes
+
+            yield anime_id, episodes
+
+    async def get_chapters(
+        self, manga: Iterable[Union[Manga, int]], *, concurrency: int = 8
+    ) -> AsyncIterator[Tuple[int, List[Chapter]]]:
+        """
+        Fetches the chapters of many Mangas, yielding the chapters of each Manga as soon as they are all fetched.
+
+        The pages of every Manga are requested from one pool with at most ``concurrency``
+        requests in flight. The chapters are also cached on the given :class:`Manga` models,
+        as with :meth:`Manga.get_chapters`.
+
+        Parameters
+        ----------
+        manga: Iterable[Union[:class:`Manga`, :class:`int`]]
+            The Mangas, or their UUIDs on Kitsu.
+        concurrency: :class:`int`, default: 8
+            The maximum number of requests in flight at once.
+
+        Yields
+        ------
+        Tuple[:class:`int`, List[:class:`Chapter`]]
+            The UUID of a Manga and its chapters, in the order the Mangas complete.
+        """
+        manga = list(manga)
+        models = {item.id: item for item in manga if isinstance(item, Manga)}
+        ids = [item.id if isinstance(item, Manga) else int(item) for item in manga]
+
+        async for manga_id, chapters in self._each(ids, self._chapters, concurrency):
+            if (model := models.get(manga_id)) is not None:
+                model.chapters = chapters
+
+            yield manga_id, chapters
 
     async def trending_anime(self) -> List[Anime]:
         """
         Fetches the top 10 trending Animes on Kitsu.
 
+        This is served from the last result while it is revalidated, see :meth:`enable_revalidation`.
+
         Returns
         -------
         List[:class:`Anime`]
         """
-        data = await self._request("trending/anime")
-        return [Anime(payload, self) for payload in data["data"]]
+        data = await self._request_hot("trending/anime")
+
+        with self._build_timer("Anime"):
+            return [Anime(payload, self) for payload in data["data"]]
 
     async def get_manga(self, manga_id: int) -> Manga:
         """
@@ -186,7 +746,34 @@ class Client:
         :class:`Manga`
         """
         data: MangaResource = await self._request(f"manga/{manga_id}")
-        return Manga(data["data"], self)
+
+        with self._build_timer("Manga"):
+            return Manga(data["data"], self)
+
+    async def get_manga_by_slug(self, slug: str) -> Optional[Manga]:
+        """
+        Fetches a Manga from the Kitsu API by its slug, see :meth:`get_anime_by_slug`.
+
+        Parameters
+        ----------
+        slug: :class:`str`
+            The slug of the Manga on Kitsu, as in its :attr:`Manga.url`.
+
+        Returns
+        -------
+        Optional[:class:`Manga`]
+            The Manga, or ``None`` if no Manga has this slug.
+        """
+        manga_id, data = await self._resolve_slug("manga", slug, {})
+
+        if manga_id is None:
+            return None
+
+        if data is None:
+            return await self.get_manga(manga_id)
+
+        with self._build_timer("Manga"):
+            return Manga(data["data"][0], self)
 
     async def search_manga(self, query: str = "", limit: int = 10) -> List[Manga]:
         """
@@ -211,19 +798,431 @@ class Client:
 
         data: MangaCollection = await self._request("manga", params=params)
 
-        return [Manga(payload, self) for payload in data["data"]]
+        with self._build_timer("Manga"):
+            return [Manga(payload, self) for payload in data["data"]]
 
     async def trending_manga(self) -> List[Manga]:
         """
         Fetches the top 10 trending Mangas on Kitsu.
 
+        This is served from the last result while it is revalidated, see :meth:`enable_revalidation`.
+
         Returns
         -------
         List[:class:`Manga`]
         """
-        data = await self._request("trending/manga")
-        return [Manga(payload, self) for payload in data["data"]]
+        data = await self._request_hot("trending/manga")
+
+        with self._build_timer("Manga"):
+            return [Manga(payload, self) for payload in data["data"]]
+
+    async def _media_franchises(self, kind: str, media_id: Union[int, str]) -> List[str]:
+        """Internal function used to fetch the ids of the franchises a media is an installment of."""
+        key = f"{kind}/{media_id}"
+
+        if (cached := self._edges.get(key)) is not None:
+            return json.loads(cached)
+
+        data = await self._request(f"{kind}/{media_id}/installments", params={"include": "franchise"})
+        franchises = [item["relationships"]["franchise"]["data"]["id"] for item in data["data"]]
+
+        self._edges.set(key, json.dumps(franchises).encode())
+        return franchises
+
+    async def _franchise_members(self, franchise_id: str) -> List[Dict[str, Any]]:
+        """Internal function used to fetch every media resource installed in a franchise."""
+        key = f"franchises/{franchise_id}"
+
+        if (cached := self._edges.get(key)) is not None:
+            return json.loads(cached)
+
+        params = {"include": "media", "page[limit]": "20"}
+        data = await self._request(f"franchises/{franchise_id}/installments", params=params)
+        members = [item for item in data.get("included", []) if item["type"] in ("anime", "manga")]
+
+        while (next_page_url := data["links"].get("next")) is not None:
+            data = await self._request(url=next_page_url)
+            members.extend(item for item in data.get("included", []) if item["type"] in ("anime", "manga"))
+
+        self._edges.set(key, json.dumps(members).encode())
+        return members
+
+    async def get_franchise(
+        self, media_id: int, *, kind: Literal["anime", "manga"] = "anime", concurrency: int = 8
+    ) -> List[Union[Anime, Manga]]:
+        """
+        Resolves every Anime and Manga connected to a media through franchise installments.
+
+        The installment graph is walked breadth-first, each discovered media and franchise
+        is requested as soon as it is found with at most ``concurrency`` requests in flight.
+        The edges are cached on the client for an hour, so resolving another media of the
+        same franchise does not repeat the walk.
+
+        Parameters
+        ----------
+        media_id: :class:`int`
+            The UUID of the Anime or Manga on Kitsu.
+        kind: Literal["anime", "manga"], default: "anime"
+            The type of the media.
+        concurrency: :class:`int`, default: 8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        List[Union[:class:`Anime`, :class:`Manga`]]
+            The media of the franchise in the order they were discovered, this is empty
+            when the media is not an installment of any franchise.
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        media: Set[Tuple[str, str]] = {(kind, str(media_id))}
+        franchises: Set[str] = set()
+        resources: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        pending: Set[asyncio.Task] = set()
+
+        async def bounded(coroutine: Any) -> Any:
+            async with semaphore:
+                return await coroutine
+
+        def visit(node: Tuple[str, str]) -> None:
+            pending.add(asyncio.create_task(bounded(self._media_franchises(*node))))
+
+        visit((kind, str(media_id)))
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    pending.discard(task)
+
+                    for item in task.result():
+                        if isinstance(item, str):
+                            if item not in franchises:
+                                franchises.add(item)
+                                pending.add(asyncio.create_task(bounded(self._franchise_members(item))))
+                            continue
+
+                        node = (item["type"], item["id"])
+                        resources.setdefault(node, item)
+
+                        if node not in media:
+                            media.add(node)
+                            visit(node)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        with self._build_timer("Franchise"):
+            return [Anime(item, self) if item["type"] == "anime" else Manga(item, self) for item in resources.values()]  # type: ignore
+
+    async def resolve_mappings(
+        self, site: str, external_ids: Iterable[Union[int, str]], *, concurrency: int = 4
+    ) -> Dict[str, Optional[int]]:
+        """
+        Resolves ids of media on another site to their ids on Kitsu.
+
+        Only the ids missing from :attr:`mappings` are requested, in batches of 20 with at
+        most ``concurrency`` batches in flight, and the results are recorded in the table
+        so later lookups do not perform a request.
+
+        Parameters
+        ----------
+        site: :class:`str`
+            The site the ids belong to as named on Kitsu, e.g. ``myanimelist/anime`` or ``anilist/manga``.
+        external_ids: Iterable[Union[:class:`int`, :class:`str`]]
+            The ids of the media on ``site``.
+        concurrency: :class:`int`, default: 4
+            The maximum number of batches requested at once.
+
+        Returns
+        -------
+        Dict[:class:`str`, Optional[:class:`int`]]
+            A mapping of each external id to the id on Kitsu, or ``None`` if it has no media on Kitsu.
+        """
+        ids = list(dict.fromkeys(str(external_id) for external_id in external_ids))
+        unknown = [external_id for external_id in ids if self._mappings._lookup(site, external_id) is _MISSING]
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def resolve(batch: List[str]) -> None:
+            params = {"filter[externalSite]": site, "filter[externalId]": ",".join(batch), "include": "item"}
+            found = set()
+
+            async with semaphore:
+                data = await self._request("mappings", params={**params, "page[limit]": "20"})
+
+                while True:
+                    for resource in data["data"]:
+                        if self._mappings.add_resource(resource):
+                            found.add(resource["attributes"]["externalId"])
+
+                    if (next_page_url := data["links"].get("next")) is None:
+                        break
+
+                    data = await self._request(url=next_page_url)
+
+            for external_id in batch:
+                if external_id not in found:
+                    self._mappings.add_missing(site, external_id)
+
+        await asyncio.gather(*(resolve(unknown[i : i + 20]) for i in range(0, len(unknown), 20)))
+
+        return {external_id: self._mappings.kitsu_id(site, external_id) for external_id in ids}
+
+    async def get_mappings(self, media_id: int, *, kind: Literal["anime", "manga"] = "anime") -> Dict[str, str]:
+        """
+        Fetches the ids of a media on other sites, they are served from :attr:`mappings` when known.
+
+        Parameters
+        ----------
+        media_id: :class:`int`
+            The UUID of the Anime or Manga on Kitsu.
+        kind: Literal["anime", "manga"], default: "anime"
+            The type of the media.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`str`]
+            A mapping of site names to the id of the media on that site.
+        """
+        if (sites := self._mappings.external_ids(kind, media_id)) is not None:
+            return sites
+
+        data = await self._request(f"{kind}/{media_id}/mappings", params={"page[limit]": "20"})
+        resources = data["data"]
+
+        while (next_page_url := data["links"].get("next")) is not None:
+            data = await self._request(url=next_page_url)
+            resources.extend(data["data"])
+
+        sites = {item["attributes"]["externalSite"]: item["attributes"]["externalId"] for item in resources}
+        self._mappings.set_external_ids(kind, media_id, sites)
+        return sites
+
+    async def fetch_image(
+        self, image: Union[Image, str], *, width: Optional[int] = None, height: Optional[int] = None
+    ) -> bytes:
+        """
+        Downloads an image, picking the smallest size at least ``width`` wide and ``height`` high.
+
+        The image is downloaded over the client's connection pool and kept in its ``image_cache``, if it has one.
+
+        Parameters
+        ----------
+        image: Union[:class:`Image`, :class:`str`]
+            The image, such as :attr:`Anime.poster_image`, or the URL of one of its sizes.
+        width: Optional[:class:`int`]
+            The minimum width in pixels of the downloaded size.
+        height: Optional[:class:`int`]
+            The minimum height in pixels of the downloaded size.
+
+        Returns
+        -------
+        :class:`bytes`
+            The content of the image.
+        """
+        url = image.url_for(width, height) if isinstance(image, Image) else image
+
+        if self._images is not None and (body := self._images.get(url)) is not None:
+            return body
+
+        response = await self._transport.request("GET", url, headers={"User-Agent": HEADERS["User-Agent"]})
+        raw = response.raw if response.raw is not None else response
+
+        if response.status == 404:
+            raise NotFound(raw, f"The image {url} could not be found.")
+        elif response.status != 200:
+            raise HTTPException(raw, f"Failed to download the image {url}.", response.status)
+
+        if self._images is not None:
+            self._images.set(url, response.body)
+
+        return response.body
+
+    async def fetch_images(
+        self,
+        images: Iterable[Union[Image, str]],
+        *,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        concurrency: int = 8,
+    ) -> List[bytes]:
+        """
+        Downloads many images with at most ``concurrency`` downloads in flight, see :meth:`fetch_image`.
+
+        Images resolving to the same URL are only downloaded once.
+
+        Parameters
+        ----------
+        images: Iterable[Union[:class:`Image`, :class:`str`]]
+            The images, or the URLs of their sizes.
+        width: Optional[:class:`int`]
+            The minimum width in pixels of the downloaded sizes.
+        height: Optional[:class:`int`]
+            The minimum height in pixels of the downloaded sizes.
+        concurrency: :class:`int`, default: 8
+            The maximum number of downloads in flight at once.
+
+        Returns
+        -------
+        List[:class:`bytes`]
+            The content of each image, in the order they were given.
+        """
+        urls = [image.url_for(width, height) if isinstance(image, Image) else image for image in images]
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(url: str) -> bytes:
+            async with semaphore:
+                return await self.fetch_image(url)
+
+        unique = list(dict.fromkeys(urls))
+        bodies = dict(zip(unique, await asyncio.gather(*(fetch(url) for url in unique))))
+        return [bodies[url] for url in urls]
+
+    async def _graphql_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Internal function used to perform GraphQL requests, whose errors are answered with any status."""
+        timings = None
+        if self._timing_sample_rate and random.random() < self._timing_sample_rate:
+            timings = RequestTimings("GET", self._graphql_url, self._timing_hook)
+
+        response = await self._fetch("GET", self._graphql_url, params, timings)
+
+        start = perf_counter()
+
+        try:
+            data = json.loads(response.body)
+        except ValueError:
+            data = None
+
+        if timings is not None:
+            timings.decode = perf_counter() - start
+            timings._dispatch()
+
+        if isinstance(data, dict) and ("data" in data or "errors" in data):
+            return data
+
+        raw = response.raw if response.raw is not None else response
+        raise HTTPException(raw, response.body.decode(errors="replace"), response.status)
+
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Performs a query on the Kitsu GraphQL API.
+
+        Queries are sent as persisted queries, by the SHA-256 hash of the query alone,
+        and only sent in full when the API does not know the hash yet. As the request
+        is a ``GET`` that only depends on the hash and the variables, the client's
+        ``cache`` can serve repeated queries.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The GraphQL query.
+        variables: Optional[Dict[:class:`str`, Any]]
+            The variables of the query.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            The ``data`` of the response.
+
+        Raises
+        ------
+        :exc:`GraphQLError`
+            The API answered with errors, whatever the status of the response.
+        :exc:`HTTPException`
+            The API answered with something other than a GraphQL response.
+        """
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+        params = {
+            "variables": json.dumps(variables or {}, sort_keys=True, separators=(",", ":")),
+            "extensions": json.dumps(extensions, separators=(",", ":")),
+        }
+
+        if not self._persisted_queries:
+            params["query"] = query
+
+        data = await self._graphql_request(params)
+        codes = {error.get("extensions", {}).get("code") for error in data.get("errors") or ()}
+
+        if codes & {"PERSISTED_QUERY_NOT_FOUND", "PERSISTED_QUERY_NOT_SUPPORTED"}:
+            key = _request_key("GET", self._graphql_url, params)
+            if self._cache is not None:
+                self._cache.delete(key)
+
+            self._persisted_queries = "PERSISTED_QUERY_NOT_SUPPORTED" not in codes
+            params["query"] = query
+            data = await self._graphql_request(params)
+
+            # The next call only sends the hash, so the response is also cached under it
+            if self._cache is not None and self._persisted_queries and not data.get("errors"):
+                self._cache.set(key, json.dumps(data).encode())
+
+        if data.get("errors"):
+            if self._cache is not None:
+                self._cache.delete(_request_key("GET", self._graphql_url, params))
+
+            raise GraphQLError(data["errors"])
+
+        return data["data"]
+
+    async def get_anime_details(self, anime_id: int, *, episodes: int = 20) -> MediaDetails:
+        """
+        Fetches an Anime with its first episodes, categories and mappings in one GraphQL request.
+
+        The mappings are recorded in :attr:`mappings`.
+
+        Parameters
+        ----------
+        anime_id: :class:`int`
+            The UUID of the Anime on Kitsu.
+        episodes: :class:`int`, default: 20
+            The number of episodes to fetch.
+
+        Returns
+        -------
+        :class:`MediaDetails`
+        """
+        data = await self.graphql(ANIME_DETAILS, {"id": str(anime_id), "episodes": episodes})
+
+        if data["findAnimeById"] is None:
+            raise NotFound(Response(404, b""), f"The record identified by {anime_id} could not be found.")
+
+        return self._details(data["findAnimeById"], "anime")
+
+    async def get_manga_details(self, manga_id: int, *, chapters: int = 20) -> MediaDetails:
+        """
+        Fetches a Manga with its first chapters, categories and mappings in one GraphQL request.
+
+        The mappings are recorded in :attr:`mappings`.
+
+        Parameters
+        ----------
+        manga_id: :class:`int`
+            The UUID of the Manga on Kitsu.
+        chapters: :class:`int`, default: 20
+            The number of chapters to fetch.
+
+        Returns
+        -------
+        :class:`MediaDetails`
+        """
+        data = await self.graphql(MANGA_DETAILS, {"id": str(manga_id), "chapters": chapters})
+
+        if data["findMangaById"] is None:
+            raise NotFound(Response(404, b""), f"The record identified by {manga_id} could not be found.")
+
+        return self._details(data["findMangaById"], "manga")
+
+    def _details(self, node: Dict[str, Any], kind: str) -> MediaDetails:
+        """Internal function used to build the details of a media and record its slug and mappings."""
+        with self._build_timer("MediaDetails"):
+            details = MediaDetails(node, self)
+
+        self._slugs.set(f"{kind}/{details.media.slug}", str(details.media.id).encode())
+        self._mappings.set_external_ids(kind, details.media.id, details.mappings)
+        return details
 
     async def close(self) -> None:
-        """Closes the internal ClientSession."""
-        return await self._session.close()
+        """Closes the transport and its internal ClientSession."""
+        self.disable_revalidation()
+        return await self._transport.close()
@@ -0,0 +1,455 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Set
+
+import aiohttp
+
+from .errors import HTTPException
+from .ratelimit import RateLimiter, SharedRateLimiter, fcntl
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .mirror import Mirror, MirrorChange
+
+__all__ = ("Crawler", "read_ndjson")
+
+_log = logging.getLogger(__name__)
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """Iterates over the resources in a compressed NDJSON file written by :class:`Crawler`.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file to read.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            yield json.loads(line)
+
+
+def _crawl_shard(
+    kind: Literal["anime", "manga"],
+    output: str,
+    offsets: range,
+    base_url: str,
+    rate: Optional[float],
+    rate_path: Optional[str],
+    concurrency: int,
+    page_size: int,
+    checkpoint: Optional[str],
+) -> int:
+    """Crawls one shard of the offsets in a worker process, with its own client and session."""
+    from .client import Client
+
+    async def run() -> int:
+        rate_limiter = None
+        if rate and rate_path is not None:
+            rate_limiter = SharedRateLimiter(rate_path, rate)
+        elif rate:
+            rate_limiter = RateLimiter(rate)
+
+        client = Client(base_url=base_url, rate_limiter=rate_limiter)
+
+        try:
+            crawler = Crawler(client, concurrency=concurrency, page_size=page_size)
+            return await crawler.crawl(kind, output, checkpoint=checkpoint, offsets=offsets)
+        finally:
+            await client.close()
+
+            if isinstance(rate_limiter, SharedRateLimiter):
+                rate_limiter.close()
+
+    return asyncio.run(run())
+
+
+def _load_plan(checkpoint: Optional[str], page_size: int) -> Optional[Dict[str, Any]]:
+    """Returns the shard plan saved next to the checkpoints of a sharded crawl, if it matches ``page_size``."""
+    if checkpoint is None or not os.path.exists(f"{checkpoint}.plan"):
+        return None
+
+    with open(f"{checkpoint}.plan", encoding="utf-8") as file:
+        plan = json.load(file)
+
+    return plan if plan["page_size"] == page_size else None
+
+
+def _save_plan(checkpoint: Optional[str], plan: Dict[str, Any]) -> None:
+    if checkpoint is None:
+        return
+
+    temporary = f"{checkpoint}.plan.tmp"
+
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(plan, file, separators=(",", ":"))
+
+    os.replace(temporary, f"{checkpoint}.plan")
+
+
+def _retry_after(error: HTTPException) -> Optional[float]:
+    """Returns the number of seconds a response asked to wait before retrying, if it did."""
+    value = getattr(error.response, "headers", {}).get("Retry-After")
+
+    try:
+        return None if value is None else max(float(value), 0.0)
+    except ValueError:
+        # An HTTP date, fall back to the exponential backoff
+        return None
+
+
+class _Checkpoint:
+    """The progress of a crawl, saved atomically after every page."""
+
+    __slots__ = ("path", "count", "page_size", "size", "done")
+
+    def __init__(self, path: Optional[str], page_size: int) -> None:
+        self.path = path
+        self.count: Optional[int] = None
+        self.page_size = page_size
+        self.size = 0
+        self.done: Set[int] = set()
+
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                payload = json.load(file)
+
+            if payload["page_size"] == page_size:
+                self.count = payload["count"]
+                self.size = payload["size"]
+                self.done = set(payload["done"])
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        payload = {"count": self.count, "page_size": self.page_size, "size": self.size, "done": sorted(self.done)}
+        temporary = f"{self.path}.tmp"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(payload, file, separators=(",", ":"))
+
+        os.replace(temporary, self.path)
+
+
+class Crawler:
+    """Walks the whole anime or manga catalogue and exports the raw resources.
+
+    Pages are requested by offset with at most ``concurrency`` requests in flight,
+    and each page is appended to the output as its own gzip member as soon as it
+    arrives, so memory use does not grow with the size of the catalogue. The
+    resources are written in the order their pages arrive.
+
+    When a ``checkpoint`` path is given the progress is saved after every page,
+    and a crawl interrupted by a crash resumes where it stopped, discarding any
+    partially written page. The checkpoint is removed once the crawl completes,
+    so the next crawl with the same path starts afresh.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to perform the requests with.
+    concurrency: :class:`int`, default: 4
+        The maximum number of pages requested at once.
+    page_size: :class:`int`, default: 20
+        The number of resources per page, it is clamped at 20 as that is the maximum supported by the API.
+    retries: :class:`int`, default: 3
+        The number of times a page is retried after a server, rate limit or connection error.
+        Rate limited pages wait for as long as the ``Retry-After`` header asks.
+    """
+
+    def __init__(self, client: Client, *, concurrency: int = 4, page_size: int = 20, retries: int = 3) -> None:
+        self.client = client
+        self.concurrency = max(concurrency, 1)
+        self.page_size = max(min(page_size, 20), 1)
+        self.retries = retries
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Crawler concurrency={self.concurrency} page_size={self.page_size}>"
+
+    async def _page(self, path: str, offset: int, **params: Any) -> Dict[str, Any]:
+        params = {"page[limit]": self.page_size, "page[offset]": offset, "sort": "id", **params}
+
+        attempt = 0
+
+        while True:
+            try:
+                return await self.client._request(path, params=params)
+            except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError) as error:
+                retryable = not isinstance(error, HTTPException) or error.status == 429 or error.status >= 500
+
+                if not retryable or attempt == self.retries:
+                    raise
+
+                delay = _retry_after(error) if isinstance(error, HTTPException) else None
+                delay = 2**attempt if delay is None else delay
+
+                _log.warning("Retrying %s at offset %s in %ss after %r", path, offset, delay, error)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def crawl(
+        self,
+        kind: Literal["anime", "manga"],
+        output: str,
+        *,
+        checkpoint: Optional[str] = None,
+        offsets: Optional[range] = None,
+    ) -> int:
+        """Crawls the catalogue of ``kind`` into a compressed NDJSON file.
+
+        Parameters
+        ----------
+        kind: Literal["anime", "manga"]
+            The catalogue to crawl.
+        output: :class:`str`
+            The path of the compressed NDJSON file to write the resources to.
+        checkpoint: Optional[:class:`str`]
+            The path of the file to save progress to, and resume from if it exists.
+        offsets: Optional[:class:`range`]
+            The page offsets to crawl, defaults to the whole catalogue.
+
+        Returns
+        -------
+        :class:`int`
+            The number of resources written by this call.
+        """
+        state = _Checkpoint(checkpoint, self.page_size)
+
+        count = state.count
+
+        if count is None:
+            first = await self._page(kind, 0, **{"page[limit]": 1})
+            count = state.count = first["meta"]["count"]
+
+        if offsets is None:
+            offsets = range(0, count, self.page_size)
+
+        pending = deque(offset for offset in offsets if offset not in state.done)
+
+        written = 0
+
+        with open(output, "ab") as file:
+            # Discard anything written after the last saved checkpoint, it belongs to an unfinished page
+            file.truncate(state.size)
+
+            async def worker() -> None:
+                nonlocal written
+
+                while pending:
+                    offset = pending.popleft()
+                    page = await self._page(kind, offset)
+                    lines = "".join(
+                        json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in page["data"]
+                    )
+
+                    file.write(gzip.compress(lines.encode()))
+                    file.flush()
+
+                    state.size = file.tell()
+                    state.done.add(offset)
+                    state.save()
+                    written += len(page["data"])
+
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+
+        if checkpoint is not None and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        _log.info("Crawled %s %s resources into %s", written, kind, output)
+        return written
+
+    async def crawl_sharded(
+        self,
+        kind: Literal["anime", "manga"],
+        output: str,
+        *,
+        processes: Optional[int] = None,
+        rate: Optional[float] = None,
+        rate_path: Optional[str] = None,
+        checkpoint: Optional[str] = None,
+    ) -> int:
+        """Crawls the catalogue of ``kind`` across a pool of processes into a compressed NDJSON file.
+
+        The page offsets are split into one contiguous shard per process, and every
+        process crawls its shard with its own :class:`Client` and session, using this
+        crawler's ``concurrency`` and ``page_size``. The shard outputs are then merged
+        into ``output``. The processes use a default transport against the same base URL
+        as this crawler's client.
+
+        Parameters
+        ----------
+        kind: Literal["anime", "manga"]
+            The catalogue to crawl.
+        output: :class:`str`
+            The path of the compressed NDJSON file to write the resources to.
+        processes: Optional[:class:`int`]
+            The number of processes to crawl with, defaults to the number of CPUs.
+        rate: Optional[:class:`float`]
+            The global limit of requests per second, shared by the processes through a
+            :class:`SharedRateLimiter`. It is split evenly between the processes on
+            platforms without :mod:`fcntl`.
+        rate_path: Optional[:class:`str`]
+            The path of the file holding the shared rate limit, defaults to a file next to
+            ``output``. Other processes limited with a :class:`SharedRateLimiter` on the same
+            path share the budget with the crawl.
+        checkpoint: Optional[:class:`str`]
+            The path prefix of the per-shard checkpoint files, to resume an interrupted crawl.
+            The catalogue size, number of processes and completed shards are saved with them,
+            so a resumed crawl keeps the shard ranges of the interrupted one and skips the
+            shards which completed.
+
+        Returns
+        -------
+        :class:`int`
+            The number of resources written by this call.
+        """
+        processes = processes or os.cpu_count() or 1
+        plan = _load_plan(checkpoint, self.page_size)
+
+        if plan is not None:
+            # Resume with the shard ranges the checkpoints were written for, even if the catalogue has grown since
+            if plan["processes"] != processes:
+                _log.info("Resuming with the %s processes of the interrupted crawl", plan["processes"])
+
+            count, processes = int(plan["count"]), int(plan["processes"])
+        else:
+            first = await self._page(kind, 0, **{"page[limit]": 1})
+            count = first["meta"]["count"]
+            plan = {"count": count, "page_size": self.page_size, "processes": processes, "done": []}
+            _save_plan(checkpoint, plan)
+
+        # A shard's checkpoint is removed when it completes, so completed shards are recorded in the plan
+        done: Set[int] = set(plan.get("done", ()))
+
+        pages = range(0, count, self.page_size)
+        size = max(-(-len(pages) // processes), 1)
+        shards = [pages[i : i + size] for i in range(0, len(pages), size)]
+
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        base_url = self.client._base
+        shard_rate = rate
+        shared_path = None
+
+        if rate and fcntl is not None:
+            shared_path = rate_path or f"{output}.rate"
+        elif rate and shards:
+            shard_rate = rate / len(shards)
+
+        with ProcessPoolExecutor(max_workers=len(shards) or 1, mp_context=context) as pool:
+
+            async def crawl_shard(index: int, shard: range) -> int:
+                written = await loop.run_in_executor(
+                    pool,
+                    _crawl_shard,
+                    kind,
+                    f"{output}.{index}",
+                    shard,
+                    base_url,
+                    shard_rate,
+                    shared_path,
+                    self.concurrency,
+                    self.page_size,
+                    f"{checkpoint}.{index}" if checkpoint is not None else None,
+                )
+
+                done.add(index)
+                _save_plan(checkpoint, {**plan, "done": sorted(done)})
+                return written
+
+            shards_left = [crawl_shard(index, shard) for index, shard in enumerate(shards) if index not in done]
+            written = sum(await asyncio.gather(*shards_left))
+
+        # Concatenated gzip members are a valid gzip file, so the shards are merged without decompressing
+        with open(output, "wb") as file:
+            for index in range(len(shards)):
+                with open(f"{output}.{index}", "rb") as shard_file:
+                    shutil.copyfileobj(shard_file, file)
+
+        for index in range(len(shards)):
+            os.remove(f"{output}.{index}")
+
+        if checkpoint is not None:
+            os.remove(f"{checkpoint}.plan")
+
+        if rate_path is None and shared_path is not None and os.path.exists(shared_path):
+            os.remove(shared_path)
+
+        _log.info("Crawled %s %s resources into %s with %s processes", written, kind, output, len(shards))
+        return written
+
+    async def sync(self, kind: Literal["anime", "manga"], mirror: Mirror) -> List[MirrorChange]:
+        """Applies the resources of ``kind`` updated since the last sync to a :class:`Mirror`.
+
+        Pages are requested sorted by ``-updatedAt``, one at a time, until a page
+        reaches resources older than the mirror's watermark, so the cost depends
+        on how much changed rather than on the size of the catalogue. An empty
+        mirror is filled with the whole catalogue.
+
+        Parameters
+        ----------
+        kind: Literal["anime", "manga"]
+            The catalogue to sync.
+        mirror: :class:`Mirror`
+            The mirror to apply the changes to, its listeners receive a :class:`MirrorChange` for each.
+
+        Returns
+        -------
+        List[:class:`MirrorChange`]
+            The changes applied to the mirror.
+        """
+        watermark = mirror.watermark(kind)
+        changes: List[MirrorChange] = []
+        offset = 0
+
+        while True:
+            page = await self._page(kind, offset, sort="-updatedAt")
+            fresh = [item for item in page["data"] if watermark is None or item["attributes"]["updatedAt"] >= watermark]
+            changes.extend(mirror.extend(fresh))
+
+            if len(fresh) < len(page["data"]) or "next" not in page["links"]:
+                break
+
+            offset += self.page_size
+
+        _log.info("Synced %s %s changes since %s", len(changes), kind, watermark)
+        return changes
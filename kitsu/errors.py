@@ -23,9 +23,14 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Dict, List, Union
+
 from aiohttp import ClientResponse
 
-__all__ = ("HTTPException", "BadRequest", "NotFound")
+if TYPE_CHECKING:
+    from .transport import Response
+
+__all__ = ("HTTPException", "BadRequest", "NotFound", "ReplayMiss", "GraphQLError")
 
 
 class HTTPException(Exception):
@@ -33,16 +38,17 @@ class HTTPException(Exception):
 
     Attributes
     ----------
-    response: :class:`~aiohttp.ClientResponse`
-        The raw response object from the request.
+    response: Union[:class:`~aiohttp.ClientResponse`, :class:`Response`]
+        The raw response object from the request, this is a :class:`Response`
+        when it was served by a transport without a network response.
     message: :class:`str`
         The error message sent by the API.
     status: :class:`int`
         The HTTP status code of the response.
     """
 
-    def __init__(self, response: ClientResponse, message: str, status: int) -> None:
-        self.response: ClientResponse = response
+    def __init__(self, response: Union[ClientResponse, Response], message: str, status: int) -> None:
+        self.response: Union[ClientResponse, Response] = response
         self.message: str = message
         self.status: int = status
 
@@ -54,16 +60,17 @@ class BadRequest(HTTPException):
 
     Attributes
     ----------
-    response: :class:`~aiohttp.ClientResponse`
-        The raw response object from the request.
+    response: Union[:class:`~aiohttp.ClientResponse`, :class:`Response`]
+        The raw response object from the request, this is a :class:`Response`
+        when it was served by a transport without a network response.
     message: :class:`str`
         The error message sent by the API.
     status: Literal[400]
         The HTTP status code of the response.
     """
 
-    def __init__(self, response: ClientResponse, message: str) -> None:
-        self.response: ClientResponse = response
+    def __init__(self, response: Union[ClientResponse, Response], message: str) -> None:
+        self.response: Union[ClientResponse, Response] = response
         self.message: str = message
 
         super().__init__(response, message, 400)
@@ -74,16 +81,50 @@ class NotFound(HTTPException):
 
     Attributes
     ----------
-    response: :class:`~aiohttp.ClientResponse`
-        The raw response object from the request.
+    response: Union[:class:`~aiohttp.ClientResponse`, :class:`Response`]
+        The raw response object from the request, this is a :class:`Response`
+        when it was served by a transport without a network response.
     message: :class:`str`
         The error message sent by the API.
     status: Literal[404]
         The HTTP status code of the response.
     """
 
-    def __init__(self, response: ClientResponse, message: str) -> None:
-        self.response: ClientResponse = response
+    def __init__(self, response: Union[ClientResponse, Response], message: str) -> None:
+        self.response: Union[ClientResponse, Response] = response
         self.message: str = message
 
         super().__init__(response, message, 404)
+
+
+class ReplayMiss(Exception):
+    """Raised when a :class:`ReplayTransport` has no recorded response for a request.
+
+    Attributes
+    ----------
+    key: :class:`str`
+        The method and URL of the request that was not recorded.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key: str = key
+
+        super().__init__(f"No recorded response for {key}")
+
+
+class GraphQLError(Exception):
+    """Raised when the GraphQL API answers a query with errors.
+
+    Attributes
+    ----------
+    errors: List[Dict[:class:`str`, Any]]
+        The errors sent by the API.
+    message: :class:`str`
+        The message of the first error.
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]]) -> None:
+        self.errors: List[Dict[str, Any]] = errors
+        self.message: str = errors[0].get("message", "Unknown error") if errors else "Unknown error"
+
+        super().__init__(self.message)
@@ -0,0 +1,278 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from .models import Anime, Category, Chapter, Episode, Manga
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = ("MediaDetails",)
+
+IMAGE = "{ original { url width height } views { name url width height } }"
+TITLES = "titles { canonical localized alternatives }"
+
+MEDIA_FIELDS = f"""
+    id
+    slug
+    {TITLES}
+    description
+    averageRating
+    averageRatingRank
+    userCount
+    userCountRank
+    favoritesCount
+    startDate
+    endDate
+    ageRating
+    ageRatingGuide
+    status
+    sfw
+    createdAt
+    updatedAt
+    posterImage {IMAGE}
+    bannerImage {IMAGE}
+    categories(first: 50) {{ nodes {{ id slug title description isNsfw createdAt updatedAt parent {{ id }} }} }}
+    mappings(first: 50) {{ nodes {{ externalSite externalId }} }}
+"""
+
+ANIME_DETAILS = f"""
+query AnimeDetails($id: ID!, $episodes: Int!) {{
+  findAnimeById(id: $id) {{
+    {MEDIA_FIELDS}
+    subtype
+    episodeCount
+    episodeLength
+    youtubeTrailerVideoId
+    episodes(first: $episodes) {{
+      nodes {{ id number {TITLES} description releasedAt length createdAt updatedAt thumbnail {IMAGE} }}
+    }}
+  }}
+}}
+"""
+
+MANGA_DETAILS = f"""
+query MangaDetails($id: ID!, $chapters: Int!) {{
+  findMangaById(id: $id) {{
+    {MEDIA_FIELDS}
+    subtype
+    chapterCount
+    volumeCount
+    chapters(first: $chapters) {{
+      nodes {{ id number {TITLES} description releasedAt length createdAt updatedAt volume {{ number }} thumbnail {IMAGE} }}
+    }}
+  }}
+}}
+"""
+
+# The GraphQL API names image sizes like the REST API, lengths are in seconds instead of minutes
+SIZES = ("tiny", "small", "medium", "large")
+
+
+def _timestamp(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _localized(value: Optional[Dict[str, str]]) -> str:
+    if not value:
+        return ""
+
+    return value.get("en", next(iter(value.values())))
+
+
+def _minutes(seconds: Optional[int]) -> Optional[int]:
+    return None if seconds is None else round(seconds / 60)
+
+
+def _image(node: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if node is None or node.get("original") is None:
+        return None
+
+    views = {view["name"]: view for view in node.get("views") or ()}
+    payload: Dict[str, Any] = {size: views[size]["url"] if size in views else None for size in SIZES}
+    payload["original"] = node["original"]["url"]
+    payload["meta"] = {
+        "dimensions": {
+            size: {"width": views[size].get("width"), "height": views[size].get("height")} for size in SIZES if size in views
+        }
+    }
+    return payload
+
+
+def _media_attributes(node: Dict[str, Any]) -> Dict[str, Any]:
+    titles = node["titles"]
+
+    return {
+        "createdAt": _timestamp(node["createdAt"]),
+        "updatedAt": _timestamp(node["updatedAt"]),
+        "slug": node["slug"],
+        "synopsis": _localized(node.get("description")),
+        "titles": titles.get("localized") or {"en": titles["canonical"]},
+        "canonicalTitle": titles["canonical"],
+        "abbreviatedTitles": titles.get("alternatives") or [],
+        "averageRating": None if node["averageRating"] is None else str(node["averageRating"]),
+        "ratingFrequencies": {},
+        "userCount": node["userCount"],
+        "favoritesCount": node["favoritesCount"],
+        "startDate": node["startDate"],
+        "endDate": node["endDate"],
+        "popularityRank": node["userCountRank"],
+        "ratingRank": node["averageRatingRank"],
+        "ageRating": node["ageRating"],
+        "ageRatingGuide": node["ageRatingGuide"],
+        "posterImage": _image(node.get("posterImage")),
+        "coverImage": _image(node.get("bannerImage")),
+        "status": node["status"].lower(),
+    }
+
+
+def anime_payload(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts an anime returned by the GraphQL API to the payload of the REST API."""
+    subtype = node["subtype"]
+    attributes = _media_attributes(node)
+    attributes.update(
+        subtype=subtype if subtype in ("ONA", "OVA", "TV") else subtype.lower(),
+        episodeCount=node["episodeCount"],
+        episodeLength=_minutes(node["episodeLength"]),
+        youtubeVideoId=node.get("youtubeTrailerVideoId"),
+        nsfw=not node["sfw"],
+    )
+    return {"id": str(node["id"]), "type": "anime", "attributes": attributes, "relationships": {}}
+
+
+def manga_payload(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a manga returned by the GraphQL API to the payload of the REST API."""
+    attributes = _media_attributes(node)
+    attributes.update(
+        subtype=node["subtype"].lower(),
+        chapterCount=node["chapterCount"],
+        volumeCount=node["volumeCount"],
+        serialization=node.get("serialization"),
+    )
+    return {"id": str(node["id"]), "type": "manga", "attributes": attributes, "relationships": {}}
+
+
+def _unit_attributes(node: Dict[str, Any]) -> Dict[str, Any]:
+    thumbnail = _image(node.get("thumbnail"))
+
+    return {
+        "createdAt": _timestamp(node["createdAt"]),
+        "updatedAt": _timestamp(node["updatedAt"]),
+        "synopsis": _localized(node.get("description")),
+        "titles": node["titles"].get("localized") or {},
+        "canonicalTitle": node["titles"]["canonical"],
+        "number": node["number"],
+        "length": _minutes(node.get("length")),
+        "thumbnail": None if thumbnail is None else {"original": thumbnail["original"]},
+    }
+
+
+def episode_payload(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts an episode returned by the GraphQL API to the payload of the REST API."""
+    attributes = _unit_attributes(node)
+    released_at = node.get("releasedAt")
+    attributes.update(
+        seasonNumber=None,
+        relativeNumber=node["number"],
+        airdate=None if released_at is None else released_at[:10],
+    )
+    return {"id": str(node["id"]), "type": "episodes", "attributes": attributes, "relationships": {}}
+
+
+def chapter_payload(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a chapter returned by the GraphQL API to the payload of the REST API."""
+    attributes = _unit_attributes(node)
+    released_at = node.get("releasedAt")
+    attributes.update(
+        volumeNumber=(node.get("volume") or {}).get("number"),
+        published=None if released_at is None else released_at[:10],
+    )
+    return {"id": str(node["id"]), "type": "chapters", "attributes": attributes, "relationships": {}}
+
+
+def category_payload(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a category returned by the GraphQL API to the payload of the REST API."""
+    parent = node.get("parent")
+
+    return {
+        "id": str(node["id"]),
+        "type": "categories",
+        "attributes": {
+            "createdAt": _timestamp(node["createdAt"]),
+            "updatedAt": _timestamp(node["updatedAt"]),
+            "title": _localized(node["title"]),
+            "description": _localized(node.get("description")) or None,
+            "slug": node["slug"],
+            "nsfw": node["isNsfw"],
+            "childCount": 0,
+            "totalMediaCount": 0,
+        },
+        "relationships": {"parent": {"data": None if parent is None else {"type": "categories", "id": str(parent["id"])}}},
+    }
+
+
+def external_site(value: str) -> str:
+    """Converts a GraphQL external site such as ``MYANIMELIST_ANIME`` to its REST name, ``myanimelist/anime``."""
+    return "/".join(value.lower().rsplit("_", 1))
+
+
+class MediaDetails:
+    """Represents an Anime or Manga fetched with everything its detail page needs in one request.
+
+    Attributes
+    ----------
+    media: Union[:class:`Anime`, :class:`Manga`]
+        The Anime, with its first :attr:`Anime.episodes`, or the Manga, with its first :attr:`Manga.chapters`.
+    categories: List[:class:`Category`]
+        The categories of the media.
+    mappings: Dict[:class:`str`, :class:`str`]
+        A mapping of site names to the id of the media on that site.
+    """
+
+    __slots__ = ("media", "categories", "mappings")
+
+    def __init__(self, node: Dict[str, Any], client: Client) -> None:
+        self.media: Union[Anime, Manga]
+
+        if "episodes" in node:
+            self.media = Anime(anime_payload(node), client)  # type: ignore
+            self.media.episodes = [Episode(episode_payload(item)) for item in node["episodes"]["nodes"]]  # type: ignore
+        else:
+            self.media = Manga(manga_payload(node), client)  # type: ignore
+            self.media.chapters = [Chapter(chapter_payload(item)) for item in node["chapters"]["nodes"]]  # type: ignore
+
+        self.categories: List[Category] = [Category(category_payload(item)) for item in node["categories"]["nodes"]]  # type: ignore
+        self.mappings: Dict[str, str] = {
+            external_site(item["externalSite"]): item["externalId"] for item in node["mappings"]["nodes"]
+        }
+
+    def __repr__(self) -> str:
+        return f"<kitsu.MediaDetails media={self.media!r}>"
@@ -0,0 +1,158 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .mirror import Mirror
+
+__all__ = ("MappingTable",)
+
+_MISSING = object()
+
+
+class MappingTable:
+    """A bidirectional table of the ids of media on other sites and their ids on Kitsu.
+
+    Sites are named as on Kitsu, e.g. ``myanimelist/anime`` or ``anilist/manga``.
+    Lookups are plain dictionary hits, entries expire after ``ttl`` seconds and
+    external ids known not to exist on Kitsu are remembered for ``missing_ttl`` seconds.
+
+    Parameters
+    ----------
+    ttl: :class:`float`, default: 604800.0
+        The number of seconds a mapping is kept for.
+    missing_ttl: :class:`float`, default: 3600.0
+        The number of seconds an external id without a mapping is remembered for.
+    """
+
+    __slots__ = ("ttl", "missing_ttl", "_kitsu", "_external")
+
+    def __init__(self, *, ttl: float = 604800.0, missing_ttl: float = 3600.0) -> None:
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self._kitsu: Dict[Tuple[str, str], Tuple[float, Optional[Tuple[str, int]]]] = {}
+        self._external: Dict[Tuple[str, int], Tuple[float, Dict[str, str]]] = {}
+
+    def __repr__(self) -> str:
+        return f"<kitsu.MappingTable size={len(self._kitsu)}>"
+
+    def __len__(self) -> int:
+        return len(self._kitsu)
+
+    def add(self, site: str, external_id: str, kind: str, kitsu_id: int) -> None:
+        """Records that ``external_id`` on ``site`` is the ``kind`` with ``kitsu_id`` on Kitsu."""
+        self._kitsu[(site, str(external_id))] = (time() + self.ttl, (kind, int(kitsu_id)))
+
+        # Only complete sets of external ids are kept per media, see set_external_ids
+        if (entry := self._external.get((kind, int(kitsu_id)))) is not None:
+            entry[1][site] = str(external_id)
+
+    def add_missing(self, site: str, external_id: str) -> None:
+        """Records that ``external_id`` on ``site`` has no media on Kitsu."""
+        self._kitsu[(site, str(external_id))] = (time() + self.missing_ttl, None)
+
+    def add_resource(self, resource: Dict[str, Any]) -> bool:
+        """Records a raw ``mappings`` resource, returns whether it held the related media.
+
+        The media is only known when the resource was requested with ``include=item``.
+        """
+        item = resource.get("relationships", {}).get("item", {}).get("data")
+
+        if resource.get("type") != "mappings" or item is None:
+            return False
+
+        attributes = resource["attributes"]
+        self.add(attributes["externalSite"], attributes["externalId"], item["type"], int(item["id"]))
+        return True
+
+    def extend(self, resources: Iterable[Dict[str, Any]]) -> int:
+        """Records many raw ``mappings`` resources and returns how many were added."""
+        return sum(self.add_resource(resource) for resource in resources)
+
+    def load_mirror(self, mirror: Mirror) -> int:
+        """Preloads every ``mappings`` resource held by a :class:`Mirror` and returns how many were added.
+
+        The mirror is expected to hold every mapping, so the external ids of each mapped media are taken as complete.
+        """
+        media: Dict[Tuple[str, int], Dict[str, str]] = {}
+
+        for resource in mirror.resources("mappings"):
+            if (item := resource.get("relationships", {}).get("item", {}).get("data")) is not None:
+                attributes = resource["attributes"]
+                media.setdefault((item["type"], int(item["id"])), {})[attributes["externalSite"]] = attributes["externalId"]
+
+        for (kind, kitsu_id), sites in media.items():
+            self.set_external_ids(kind, kitsu_id, sites)
+
+        return sum(len(sites) for sites in media.values())
+
+    def _lookup(self, site: str, external_id: str) -> Any:
+        # None means the external id has no media on Kitsu, _MISSING that it is unknown or expired
+        key = (site, str(external_id))
+
+        if (entry := self._kitsu.get(key)) is None:
+            return _MISSING
+
+        expires, value = entry
+
+        if expires <= time():
+            del self._kitsu[key]
+            return _MISSING
+
+        return value
+
+    def kitsu_id(self, site: str, external_id: str) -> Optional[int]:
+        """Returns the id on Kitsu of an external id, if it is known."""
+        value = self._lookup(site, external_id)
+        return None if value is _MISSING or value is None else value[1]
+
+    def external_ids(self, kind: str, kitsu_id: int) -> Optional[Dict[str, str]]:
+        """Returns the known external ids of a media on Kitsu keyed by site, or ``None`` if it has not been looked up."""
+        key = (kind, int(kitsu_id))
+
+        if (entry := self._external.get(key)) is None:
+            return None
+
+        expires, sites = entry
+
+        if expires <= time():
+            del self._external[key]
+            return None
+
+        return dict(sites)
+
+    def set_external_ids(self, kind: str, kitsu_id: int, sites: Dict[str, str]) -> None:
+        """Records the complete set of external ids of a media on Kitsu, which may be empty."""
+        for site, external_id in sites.items():
+            self.add(site, external_id, kind, kitsu_id)
+
+        self._external[(kind, int(kitsu_id))] = (time() + self.ttl, dict(sites))
+
+    def clear(self) -> None:
+        """Removes every mapping from the table."""
+        self._kitsu.clear()
+        self._external.clear()
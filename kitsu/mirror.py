@@ -0,0 +1,186 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Union
+
+from .models import Anime, Episode, Manga
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = ("Mirror", "MirrorChange")
+
+
+class MirrorChange:
+    """Represents a change applied to a :class:`Mirror`.
+
+    Attributes
+    ----------
+    action: Literal["created", "updated"]
+        Whether the resource was new to the mirror or replaced an older copy.
+    type: :class:`str`
+        The JSON:API type of the resource, e.g. ``anime`` or ``manga``.
+    id: :class:`int`
+        The id of the resource.
+    resource: Dict[:class:`str`, Any]
+        The raw resource as returned by the API.
+    """
+
+    __slots__ = ("action", "type", "id", "resource")
+
+    def __init__(self, action: Literal["created", "updated"], resource: Dict[str, Any]) -> None:
+        self.action = action
+        self.type: str = resource["type"]
+        self.id = int(resource["id"])
+        self.resource = resource
+
+    def __repr__(self) -> str:
+        return f"<kitsu.MirrorChange action={self.action} type={self.type} id={self.id}>"
+
+
+class Mirror:
+    """A local copy of raw Kitsu resources, kept up to date with upserts.
+
+    Resources are stored as returned by the API and grouped by their JSON:API
+    type, models are only built when they are requested. The mirror can be
+    filled from the output of a :class:`~kitsu.crawler.Crawler` and kept fresh
+    with :meth:`~kitsu.crawler.Crawler.sync`.
+
+    Parameters
+    ----------
+    client: Optional[:class:`Client`]
+        The client given to the models built from this mirror.
+    """
+
+    def __init__(self, client: Optional[Client] = None) -> None:
+        self.client = client
+        self._resources: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._watermarks: Dict[str, str] = {}
+        self._listeners: List[Callable[[MirrorChange], Any]] = []
+
+    def __repr__(self) -> str:
+        counts = " ".join(f"{kind}={len(resources)}" for kind, resources in self._resources.items())
+        return f"<kitsu.Mirror {counts}>"
+
+    def __len__(self) -> int:
+        return sum(len(resources) for resources in self._resources.values())
+
+    def add_listener(self, listener: Callable[[MirrorChange], Any]) -> None:
+        """Registers a callable invoked with a :class:`MirrorChange` for every created or updated resource."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[MirrorChange], Any]) -> None:
+        """Unregisters a listener added with :meth:`add_listener`."""
+        self._listeners.remove(listener)
+
+    def watermark(self, kind: str) -> Optional[str]:
+        """Returns the latest ``updatedAt`` timestamp among the mirrored resources of ``kind``."""
+        return self._watermarks.get(kind)
+
+    def upsert(self, resource: Dict[str, Any]) -> Optional[MirrorChange]:
+        """Inserts or replaces a raw resource.
+
+        Returns
+        -------
+        Optional[:class:`MirrorChange`]
+            The applied change, or ``None`` if the mirror already held this version of the resource.
+        """
+        kind = resource["type"]
+        resource_id = int(resource["id"])
+        resources = self._resources.setdefault(kind, {})
+        updated_at = resource["attributes"].get("updatedAt")
+
+        if (current := resources.get(resource_id)) is not None:
+            if current["attributes"].get("updatedAt") == updated_at and current["attributes"] == resource["attributes"]:
+                return None
+
+            change = MirrorChange("updated", resource)
+        else:
+            change = MirrorChange("created", resource)
+
+        resources[resource_id] = resource
+
+        if updated_at is not None and updated_at > self._watermarks.get(kind, ""):
+            self._watermarks[kind] = updated_at
+
+        for listener in self._listeners:
+            listener(change)
+
+        return change
+
+    def extend(self, resources: Iterable[Dict[str, Any]]) -> List[MirrorChange]:
+        """Upserts many raw resources and returns the applied changes."""
+        return [change for resource in resources if (change := self.upsert(resource)) is not None]
+
+    def get(self, kind: str, resource_id: int) -> Optional[Dict[str, Any]]:
+        """Returns the raw resource of ``kind`` with the given id, if it is mirrored."""
+        return self._resources.get(kind, {}).get(resource_id)
+
+    def resources(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """Iterates over the raw resources of ``kind``."""
+        return iter(list(self._resources.get(kind, {}).values()))
+
+    def model(self, resource: Dict[str, Any]) -> Union[Anime, Manga, Episode]:
+        """Builds the model matching the type of a raw resource."""
+        if resource["type"] == "anime":
+            return Anime(resource, self.client)  # type: ignore
+        elif resource["type"] == "manga":
+            return Manga(resource, self.client)  # type: ignore
+        elif resource["type"] == "episodes":
+            return Episode(resource)  # type: ignore
+
+        raise ValueError(f"No model for resources of type {resource['type']!r}")
+
+    def anime(self) -> Iterator[Anime]:
+        """Iterates over the mirrored anime as :class:`Anime` models."""
+        return (Anime(resource, self.client) for resource in self.resources("anime"))  # type: ignore
+
+    def manga(self) -> Iterator[Manga]:
+        """Iterates over the mirrored manga as :class:`Manga` models."""
+        return (Manga(resource, self.client) for resource in self.resources("manga"))  # type: ignore
+
+    def episodes(self) -> Iterator[Episode]:
+        """Iterates over the mirrored episodes as :class:`Episode` models."""
+        return (Episode(resource) for resource in self.resources("episodes"))  # type: ignore
+
+    def load(self, path: str) -> List[MirrorChange]:
+        """Upserts every resource from a compressed NDJSON file, such as one written by :class:`~kitsu.crawler.Crawler`."""
+        from .crawler import read_ndjson
+
+        return self.extend(read_ndjson(path))
+
+    def save(self, path: str) -> None:
+        """Writes every mirrored resource to a compressed NDJSON file, replacing it atomically."""
+        temporary = f"{path}.tmp"
+
+        with gzip.open(temporary, "wt", encoding="utf-8") as file:
+            for resources in self._resources.values():
+                for resource in resources.values():
+                    file.write(json.dumps(resource, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+        os.replace(temporary, path)
@@ -22,5 +22,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 from .anime import Anime, Episode
-from .manga import Manga
-from .common import Image
\ No newline at end of file
+from .category import Category
+from .manga import Chapter, Manga
+from .common import Image
@@ -24,13 +24,14 @@ SOFTWARE.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+
+from ..enums import AgeRating, AnimeSubtype, Status
+from .common import Image
 
 if TYPE_CHECKING:
     from ..client import Client
-    from ..enums import AgeRating, AnimeSubtype, Status
-    from ..types import AnimeData, EpisodeCollection, EpisodeData
-    from .common import Image
+    from ..types import AnimeData, EpisodeData
 
 
 class Episode:
@@ -281,7 +282,7 @@ class Anime:
     def episodes(self) -> Optional[List[Episode]]:
         """The episodes for this Anime."""
 
-        if self.__episodes:
+        if self.__episodes is None:
             if not self._included:
                 return None
 
@@ -301,21 +302,15 @@ class Anime:
     async def get_episodes(self) -> Optional[List[Episode]]:
         """Fetches the episodes for this Anime and caches the response.
 
+        The pages after the first are requested concurrently, see :meth:`Client.get_episodes`
+        to fetch the episodes of many Animes at once.
+
         Returns
         -------
         Optional[List[:class:`Episode`]]
         """
         if self.episodes is None:
-            data: EpisodeCollection = await self._client._request(f"anime/{self.id}/episodes", params={"page[limit]": 20})
-            episodes = [Episode(payload) for payload in data["data"]]
-
-            next_page_url = data["links"].get("next")
-
-            while next_page_url is not None:
-                next_page: EpisodeCollection = await self._client._request(url=next_page_url)
-                next_page_url = next_page["links"].get("next")
-
-                episodes.extend(Episode(payload) for payload in next_page["data"])
+            episodes = await self._client._episodes(self.id)
 
             if not episodes:
                 return None
@@ -323,3 +318,17 @@ class Anime:
             self.episodes = episodes
 
         return self.episodes
+
+    def iter_episodes(self, *, read_ahead: int = 1) -> AsyncIterator[Episode]:
+        """Streams the episodes of this Anime as their pages arrive, without caching them.
+
+        Parameters
+        ----------
+        read_ahead: :class:`int`, default: 1
+            The number of pages requested while the current one is consumed.
+
+        Yields
+        ------
+        :class:`Episode`
+        """
+        return self._client.iter_episodes(self.id, read_ahead=read_ahead)
@@ -0,0 +1,98 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..types import CategoryData
+
+
+class Category:
+    """Represents a Category returned from the Kitsu API.
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The UUID associated with this Category on Kitsu.
+    slug: :class:`str`
+        The unique string identifier for this Category, as used by the ``categories`` search filter.
+    title: :class:`str`
+        The title of this Category.
+    description: Optional[:class:`str`]
+        The description of this Category.
+    nsfw: :class:`bool`
+        Whether this Category is marked as NSFW.
+    child_count: :class:`int`
+        The number of Categories nested under this Category.
+    total_media_count: :class:`int`
+        The number of Animes and Mangas in this Category.
+    parent_id: Optional[:class:`int`]
+        The UUID of the parent Category, if this Category has one and it was returned with the payload.
+    """
+
+    __slots__ = (
+        "_data",
+        "_attributes",
+        "id",
+        "slug",
+        "title",
+        "description",
+        "nsfw",
+        "child_count",
+        "total_media_count",
+        "parent_id",
+    )
+
+    def __init__(self, payload: CategoryData) -> None:
+        self._data = payload
+        self._attributes = payload["attributes"]
+
+        self.id = int(self._data["id"])
+        self.slug = self._attributes["slug"]
+        self.title = self._attributes["title"]
+        self.description = self._attributes["description"]
+        self.nsfw = self._attributes["nsfw"]
+        self.child_count = self._attributes["childCount"]
+        self.total_media_count = self._attributes["totalMediaCount"]
+
+        parent = self._data.get("relationships", {}).get("parent", {}).get("data")
+        self.parent_id = None if parent is None else int(parent["id"])
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Category id={self.id} title={self.title}>"
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def created_at(self) -> datetime:
+        """The UTC datetime of when this Category was created."""
+        return datetime.strptime(self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """The UTC datetime of when this Category was last updated."""
+        return datetime.strptime(self._attributes["updatedAt"], "%Y-%m-%dT%H:%M:%S.%fZ")
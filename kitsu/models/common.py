@@ -23,12 +23,15 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 if TYPE_CHECKING:
     from ..types import Image as ImagePayload
 
 
+SIZES = ("tiny", "small", "medium", "large")
+
+
 class Image:
     """
     Represents a poster/cover image for an Anime or Manga.
@@ -39,15 +42,17 @@ class Image:
         The URL of this image in its tiny size.
     small: :class:`str`
         The URL of this image in its small size.
-    medium: :class:`str`
+    medium: Optional[:class:`str`]
         The URL of this image in its medium size.
     large: :class:`str`
         The URL of this image in its large size.
     original: :class:`str`
         The URL of this image in its original size.
+    dimensions: Dict[:class:`str`, Tuple[:class:`int`, :class:`int`]]
+        A mapping of size names to their width and height, for the sizes with known dimensions.
     """
 
-    __slots__ = ("_data", "tiny", "small", "medium", "large", "original")
+    __slots__ = ("_data", "tiny", "small", "medium", "large", "original", "dimensions")
 
     def __init__(self, payload: ImagePayload) -> None:
         self._data = payload
@@ -57,3 +62,32 @@ class Image:
         self.medium = self._data["medium"]
         self.large = self._data["large"]
         self.original = self._data["original"]
+
+        self.dimensions: Dict[str, Tuple[int, int]] = {}
+
+        dimensions = cast(Dict[str, Any], (self._data.get("meta") or {}).get("dimensions") or {})
+
+        for size in SIZES:
+            dimension = dimensions.get(size) or {}
+            if dimension.get("width") is not None and dimension.get("height") is not None:
+                self.dimensions[size] = (int(dimension["width"]), int(dimension["height"]))
+
+    def best_size(self, width: Optional[int] = None, height: Optional[int] = None) -> str:
+        """Returns the name of the smallest size at least ``width`` wide and ``height`` high.
+
+        Falls back to ``original`` when no size with known dimensions is large enough.
+        """
+        candidates = [
+            (size_width * size_height, size)
+            for size, (size_width, size_height) in self.dimensions.items()
+            if size in SIZES
+            and getattr(self, size) is not None
+            and size_width >= (width or 0)
+            and size_height >= (height or 0)
+        ]
+
+        return min(candidates)[1] if candidates else "original"
+
+    def url_for(self, width: Optional[int] = None, height: Optional[int] = None) -> str:
+        """Returns the URL of the smallest size at least ``width`` wide and ``height`` high, see :meth:`best_size`."""
+        return getattr(self, self.best_size(width, height))
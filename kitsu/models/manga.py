@@ -24,14 +24,101 @@ SOFTWARE.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 from ..enums import AgeRating, MangaSubtype, Status
+from .common import Image
 
 if TYPE_CHECKING:
     from ..client import Client
-    from ..types import MangaData
-    from .common import Image
+    from ..types import ChapterData, MangaData
+
+
+class Chapter:
+    """Represents a Chapter returned from the Kitsu API.
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The UUID associated with the Chapter on Kitsu.
+    synopsis: :class:`str`
+        The synopsis/description of this Chapter.
+    description: :class:`str`
+        Alias to synopsis.
+    canonical_title: Optional[:class:`str`]
+        The canonical title of this Chapter.
+    volume_number: :class:`int`
+        The number of the volume in which this Chapter appears.
+    number: :class:`int`
+        The Chapter number.
+    length: Optional[:class:`int`]
+        The number of pages of this Chapter.
+    """
+
+    __slots__ = (
+        "_data",
+        "_attributes",
+        "id",
+        "synopsis",
+        "description",
+        "_titles",
+        "canonical_title",
+        "volume_number",
+        "number",
+        "length",
+    )
+
+    def __init__(self, payload: ChapterData) -> None:
+        self._data = payload
+        self._attributes = payload["attributes"]
+
+        self.id = int(self._data["id"])
+        self.synopsis = self._attributes["synopsis"]
+        self.description = self.synopsis
+        self._titles = self._attributes["titles"]
+        self.canonical_title = self._attributes["canonicalTitle"]
+        self.volume_number = self._attributes["volumeNumber"]
+        self.number = self._attributes["number"]
+        self.length = self._attributes["length"]
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Chapter id={self.id} title={self.title}>"
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def title(self) -> str:
+        """The title of the Chapter, defaults to ``en`` language key in the
+        titles mapping, fall backs to the next available key if the ``en``
+        key is not present, and to the Chapter number if it has no titles.
+        """
+        if not self._titles:
+            return self.canonical_title or f"Chapter {self.number}"
+
+        return self._titles.get("en", (list(self._titles.values())[0]))
+
+    @property
+    def created_at(self) -> datetime:
+        """The UTC datetime of when this Chapter was created."""
+        return datetime.strptime(self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """The UTC datetime of when this Chapter was last updated."""
+        return datetime.strptime(self._attributes["updatedAt"], "%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @property
+    def published(self) -> Optional[datetime]:
+        """The UTC datetime of when this Chapter was published, if it is known."""
+        if (payload := self._attributes["published"]) is not None:
+            return datetime.strptime(payload, "%Y-%m-%d")
+
+    @property
+    def thumbnail(self) -> Optional[str]:
+        """The URL to the thumbnail of this Chapter."""
+        if (thumbnail := self._attributes["thumbnail"]) is not None:
+            return thumbnail["original"]
 
 
 class Manga:
@@ -103,6 +190,7 @@ class Manga:
         "chapter_count",
         "volume_count",
         "serialization",
+        "__chapters",
     )
 
     def __init__(self, payload: MangaData, client: Client) -> None:
@@ -131,6 +219,8 @@ class Manga:
         self.volume_count = self._attributes["volumeCount"]
         self.serialization = self._attributes["serialization"]
 
+        self.__chapters: Optional[List[Chapter]] = None
+
     def __repr__(self) -> str:
         return f"<kitsu.Manga id={self.id} title={self.title}>"
 
@@ -182,3 +272,46 @@ class Manga:
         """The cover image of this Manga."""
         if (payload := self._attributes["coverImage"]) is not None:
             return Image(payload)
+
+    @property
+    def chapters(self) -> Optional[List[Chapter]]:
+        """The chapters for this Manga, if they have been fetched."""
+        return self.__chapters
+
+    @chapters.setter
+    def chapters(self, value: List[Chapter]) -> None:
+        self.__chapters = [item for item in value if isinstance(item, Chapter)]
+
+    async def get_chapters(self) -> Optional[List[Chapter]]:
+        """Fetches the chapters for this Manga and caches the response.
+
+        The pages after the first are requested concurrently, see :meth:`Client.get_chapters`
+        to fetch the chapters of many Mangas at once and :meth:`iter_chapters` to stream them.
+
+        Returns
+        -------
+        Optional[List[:class:`Chapter`]]
+        """
+        if self.chapters is None:
+            chapters = await self._client._chapters(self.id)
+
+            if not chapters:
+                return None
+
+            self.chapters = chapters
+
+        return self.chapters
+
+    def iter_chapters(self, *, read_ahead: int = 1) -> AsyncIterator[Chapter]:
+        """Streams the chapters of this Manga as their pages arrive, without caching them.
+
+        Parameters
+        ----------
+        read_ahead: :class:`int`, default: 1
+            The number of pages requested while the current one is consumed.
+
+        Yields
+        ------
+        :class:`Chapter`
+        """
+        return self._client.iter_chapters(self.id, read_ahead=read_ahead)
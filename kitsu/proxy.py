@@ -0,0 +1,161 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from aiohttp import web
+
+from .cache import FileCache, MemoryCache
+from .client import Client
+from .ratelimit import RateLimiter
+from .transport import Response, _request_key
+
+__all__ = ("Proxy",)
+
+_log = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/vnd.api+json"
+
+
+class Proxy:
+    """A caching HTTP proxy which serves the Kitsu API paths to any number of consumers.
+
+    Every ``GET`` request under ``prefix`` is forwarded through the client, so it
+    shares the client's cache and rate limiter. Identical requests that arrive
+    while one is already in flight wait for it instead of going upstream, and
+    links in the responses are rewritten to point back at the proxy.
+
+    Parameters
+    ----------
+    client: Optional[:class:`Client`]
+        The client to forward requests with, defaults to one with a :class:`MemoryCache`.
+    prefix: :class:`str`, default: "/api/edge"
+        The path the API is served under.
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        The number of requests served.
+    upstream: :class:`int`
+        The number of requests forwarded upstream, cache hits included.
+    """
+
+    def __init__(self, client: Optional[Client] = None, *, prefix: str = "/api/edge") -> None:
+        self.client = client or Client(cache=MemoryCache())
+        self.prefix = prefix.rstrip("/")
+        self.requests = 0
+        self.upstream = 0
+
+        self._inflight: Dict[str, asyncio.Future[Response]] = {}
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Proxy prefix={self.prefix} requests={self.requests} upstream={self.upstream}>"
+
+    def application(self) -> web.Application:
+        """Creates the :class:`aiohttp.web.Application` serving the proxy."""
+        app = web.Application()
+        app.router.add_get(f"{self.prefix}/{{path:.*}}", self._handle)
+        return app
+
+    async def _forward(self, key: str, url: str, params: Dict[str, str]) -> Response:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.upstream += 1
+
+        try:
+            response = await self.client._fetch("GET", url, params)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # Waiters re-raise it, so it does not need to be retrieved here
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+
+        url = f"{self.client._base}/{request.match_info['path']}"
+        params = dict(request.query)
+        key = _request_key("GET", url, params)
+
+        if (inflight := self._inflight.get(key)) is not None:
+            response = await asyncio.shield(inflight)
+        else:
+            response = await self._forward(key, url, params)
+
+        body = response.body.replace(self.client._base.encode(), f"{request.url.origin()}{self.prefix}".encode())
+        return web.Response(body=body, status=response.status, content_type=CONTENT_TYPE)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> web.AppRunner:
+        """Starts serving the proxy and returns the runner, clean it up to stop serving."""
+        runner = web.AppRunner(self.application(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+
+        _log.info("Serving the Kitsu API proxy on http://%s:%s%s", host, port, self.prefix)
+        return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m kitsu.proxy", description="Run a caching proxy for the Kitsu API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--ttl", type=float, default=300.0, help="seconds responses are cached for")
+    parser.add_argument("--cache-dir", help="share the cache through this directory instead of memory")
+    parser.add_argument("--rate", type=float, help="limit upstream requests per second")
+    parser.add_argument("--upstream", default=None, help="the base URL of the upstream API")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def run() -> None:
+        cache = FileCache(args.cache_dir, ttl=args.ttl) if args.cache_dir else MemoryCache(ttl=args.ttl, max_size=100000)
+        options = {"base_url": args.upstream} if args.upstream else {}
+        client = Client(cache=cache, rate_limiter=RateLimiter(args.rate) if args.rate else None, **options)
+        runner = await Proxy(client).start(args.host, args.port)
+
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+            await client.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+from time import monotonic, time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+__all__ = ("RateLimiter", "SharedRateLimiter")
+
+
+class RateLimiter:
+    """A token bucket limiting how many requests a :class:`Client` performs per second.
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        The number of requests allowed per second.
+    burst: :class:`int`, default: 1
+        The number of requests that can be performed at once after a quiet period.
+    """
+
+    def __init__(self, rate: float, *, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<kitsu.RateLimiter rate={self.rate} burst={self.burst}>"
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Waits until a request is allowed to be performed."""
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+
+class SharedRateLimiter(RateLimiter):
+    """A token bucket stored in a file, shared by every process on a host that uses the same path.
+
+    The bucket is read and updated under an exclusive file lock, so several
+    :class:`Client` instances in different processes respect one combined limit.
+    This requires a platform with :mod:`fcntl`.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file holding the bucket, it is created if it does not exist.
+    rate: :class:`float`
+        The number of requests allowed per second across every process.
+    burst: :class:`int`, default: 1
+        The number of requests that can be performed at once after a quiet period.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: str, rate: float, *, burst: int = 1) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedRateLimiter requires the fcntl module, which is not available on this platform")
+
+        super().__init__(rate, burst=burst)
+        self.path = path
+        self._descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def __repr__(self) -> str:
+        return f"<kitsu.SharedRateLimiter path={self.path} rate={self.rate} burst={self.burst}>"
+
+    def _take(self) -> float:
+        """Takes a token if one is available, otherwise returns the seconds until one will be."""
+        fcntl.flock(self._descriptor, fcntl.LOCK_EX)
+
+        try:
+            payload = os.pread(self._descriptor, self._STATE.size, 0)
+            now = time()
+
+            if len(payload) == self._STATE.size:
+                tokens, updated = self._STATE.unpack(payload)
+                tokens = min(tokens + (now - updated) * self.rate, self.burst)
+            else:
+                tokens = float(self.burst)
+
+            if tokens < 1:
+                return (1 - tokens) / self.rate
+
+            os.pwrite(self._descriptor, self._STATE.pack(tokens - 1, now), 0)
+            return 0.0
+        finally:
+            fcntl.flock(self._descriptor, fcntl.LOCK_UN)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while (delay := self._take()) > 0:
+                await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """Closes the file holding the bucket."""
+        os.close(self._descriptor)
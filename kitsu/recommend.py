@@ -0,0 +1,286 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
+
+from .analytics import RATINGS, _numpy, _rating_column
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .mirror import Mirror, MirrorChange
+
+__all__ = ("Recommender",)
+
+# The relative weight of each group of features in the similarity
+WEIGHTS = {"categories": 1.0, "subtype": 0.5, "ratings": 0.5, "popularity": 0.25}
+
+
+def _related(resource: Dict[str, Any], name: str) -> List[str]:
+    """Returns the ids of a relationship, when the resource was fetched with it included."""
+    data = resource.get("relationships", {}).get(name, {}).get("data") or ()
+    return [f"{name}:{item['id']}" for item in data]
+
+
+class Recommender:
+    """Precomputed "if you liked this" neighbours over a catalogue of anime or manga.
+
+    Every media is described by a feature vector of its categories and genres, its
+    subtype, the shape of its rating distribution and its popularity, and the
+    ``k`` most similar media by cosine similarity are computed with blocked matrix
+    products. Updating a media only recomputes the neighbours it affects.
+
+    Categories and genres are read from the resources' relationships when they were
+    fetched with them included, and can also be given explicitly, e.g. from a
+    category registry. This requires `numpy <https://numpy.org>`_ to be installed.
+
+    Parameters
+    ----------
+    k: :class:`int`, default: 10
+        The number of neighbours kept for every media.
+    weights: Optional[Mapping[:class:`str`, :class:`float`]]
+        Overrides for the relative weights of the ``categories``, ``subtype``,
+        ``ratings`` and ``popularity`` features.
+    """
+
+    _BLOCK = 1024
+
+    def __init__(self, *, k: int = 10, weights: Optional[Mapping[str, float]] = None) -> None:
+        self.k = k
+        self.weights = {**WEIGHTS, **(weights or {})}
+
+        self._ids: List[int] = []
+        self._rows: Dict[int, int] = {}
+        self._tags: List[List[str]] = []
+        self._resources: List[Dict[str, Any]] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._neighbours: Optional[np.ndarray] = None
+        self._scores: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Recommender size={len(self._ids)} features={len(self._vocabulary)} k={self.k}>"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @classmethod
+    def from_mirror(
+        cls,
+        mirror: Mirror,
+        kind: Literal["anime", "manga"] = "anime",
+        *,
+        categories: Optional[Mapping[int, Iterable[str]]] = None,
+        k: int = 10,
+        follow: bool = False,
+    ) -> Recommender:
+        """Builds the neighbours of every anime or manga in a :class:`Mirror`.
+
+        Parameters
+        ----------
+        mirror: :class:`Mirror`
+            The mirror to build from.
+        kind: Literal["anime", "manga"], default: "anime"
+            The catalogue to build from.
+        categories: Optional[Mapping[:class:`int`, Iterable[:class:`str`]]]
+            The category slugs of each media, by id.
+        k: :class:`int`, default: 10
+            The number of neighbours kept for every media.
+        follow: :class:`bool`, default: False
+            Whether to update the neighbours as changes are applied to the mirror.
+        """
+        categories = categories or {}
+        recommender = cls(k=k)
+
+        for resource in mirror.resources(kind):
+            recommender._insert(resource, categories.get(int(resource["id"]), ()))
+
+        recommender.build()
+
+        if follow:
+
+            def apply(change: MirrorChange) -> None:
+                if change.type == kind:
+                    recommender.update(change.resource, categories.get(change.id, ()))
+
+            mirror.add_listener(apply)
+
+        return recommender
+
+    def _insert(self, resource: Dict[str, Any], categories: Iterable[str]) -> int:
+        attributes = resource["attributes"]
+        tags = [*_related(resource, "categories"), *_related(resource, "genres")]
+        tags += [f"category:{category}" for category in categories]
+        tags.append(f"subtype:{attributes.get('subtype')}")
+
+        for tag in tags:
+            self._vocabulary.setdefault(tag, len(self._vocabulary))
+
+        media_id = int(resource["id"])
+
+        if (row := self._rows.get(media_id)) is None:
+            row = self._rows[media_id] = len(self._ids)
+            self._ids.append(media_id)
+            self._tags.append(tags)
+            self._resources.append(resource)
+        else:
+            self._tags[row] = tags
+            self._resources[row] = resource
+
+        return row
+
+    def _vector(self, row: int, width: int) -> np.ndarray:
+        numpy = _numpy()
+        vector = numpy.zeros(width, dtype=numpy.float32)
+        attributes = self._resources[row]["attributes"]
+
+        categories = [self._vocabulary[tag] for tag in self._tags[row] if not tag.startswith("subtype:")]
+        subtypes = [self._vocabulary[tag] for tag in self._tags[row] if tag.startswith("subtype:")]
+
+        if categories:
+            vector[categories] = self.weights["categories"] / math.sqrt(len(categories))
+
+        vector[subtypes] = self.weights["subtype"]
+
+        frequencies = numpy.zeros(len(RATINGS), dtype=numpy.float32)
+        for rating, count in (attributes.get("ratingFrequencies") or {}).items():
+            if (column := _rating_column(rating)) is not None:
+                frequencies[column] = float(count)
+
+        if (norm := numpy.linalg.norm(frequencies)) > 0:
+            vector[width - len(RATINGS) - 1 : width - 1] = frequencies / norm * self.weights["ratings"]
+
+        # Popularity on a log scale, a million users counts as fully popular
+        popularity = min(math.log1p(attributes.get("userCount") or 0) / math.log1p(1_000_000), 1.0)
+        vector[width - 1] = popularity * self.weights["popularity"]
+
+        if (norm := numpy.linalg.norm(vector)) > 0:
+            vector /= norm
+
+        return vector
+
+    def _width(self) -> int:
+        return len(self._vocabulary) + len(RATINGS) + 1
+
+    def _top(self, similarities: np.ndarray, exclude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the ``k`` best columns of each row of ``similarities``, excluding the row's own media."""
+        numpy = _numpy()
+        similarities[numpy.arange(len(exclude)), exclude] = -numpy.inf
+        k = min(self.k, similarities.shape[1] - 1)
+
+        if k <= 0:
+            empty = numpy.empty((len(exclude), 0))
+            return empty.astype(numpy.int64), empty.astype(numpy.float32)
+
+        indices = numpy.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        scores = numpy.take_along_axis(similarities, indices, axis=1)
+        order = numpy.argsort(-scores, axis=1, kind="stable")
+        return numpy.take_along_axis(indices, order, axis=1), numpy.take_along_axis(scores, order, axis=1)
+
+    def build(self) -> None:
+        """Computes the feature matrix and the neighbours of every media from scratch."""
+        numpy = _numpy()
+        width = self._width()
+        self._matrix = numpy.stack([self._vector(row, width) for row in range(len(self._ids))]) if self._ids else None
+
+        if self._matrix is None:
+            return
+
+        neighbours, scores = [], []
+
+        for start in range(0, len(self._ids), self._BLOCK):
+            block = self._matrix[start : start + self._BLOCK]
+            indices, values = self._top(block @ self._matrix.T, numpy.arange(start, start + len(block)))
+            neighbours.append(indices)
+            scores.append(values)
+
+        self._neighbours = numpy.concatenate(neighbours)
+        self._scores = numpy.concatenate(scores)
+
+    def update(self, resource: Dict[str, Any], categories: Iterable[str] = ()) -> None:
+        """Adds or replaces a media and recomputes the neighbours it affects.
+
+        Parameters
+        ----------
+        resource: Dict[:class:`str`, Any]
+            The raw anime or manga resource.
+        categories: Iterable[:class:`str`]
+            The category slugs of the media.
+        """
+        numpy = _numpy()
+        width = self._width()
+        row = self._insert(resource, categories)
+
+        # New categories or genres change the layout of every vector
+        matrix, neighbours, scores = self._matrix, self._neighbours, self._scores
+        if matrix is None or neighbours is None or scores is None or self._width() != width:
+            return self.build()
+
+        vector = self._vector(row, width)
+
+        if row == len(matrix):
+            k = neighbours.shape[1]
+            matrix = self._matrix = numpy.vstack([matrix, vector])
+            neighbours = self._neighbours = numpy.vstack([neighbours, numpy.zeros((1, k), dtype=neighbours.dtype)])
+            scores = self._scores = numpy.vstack([scores, numpy.zeros((1, k), dtype=scores.dtype)])
+        else:
+            matrix[row] = vector
+
+        # Rows which listed this media, or would now list it, recompute their neighbours
+        similarities = matrix @ vector
+        kth = scores[:, -1] if scores.shape[1] else numpy.full(len(scores), -numpy.inf)
+        affected = numpy.flatnonzero((neighbours == row).any(axis=1) | (similarities > kth))
+        affected = numpy.union1d(affected, [row])
+
+        indices, values = self._top(matrix[affected] @ matrix.T, affected)
+
+        # The catalogue was smaller than k, so every row gains a neighbour
+        if indices.shape[1] != neighbours.shape[1]:
+            return self.build()
+
+        neighbours[affected] = indices
+        scores[affected] = values
+
+    def similar(self, media_id: int, count: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Returns the ids and cosine similarities of the media most similar to ``media_id``.
+
+        Parameters
+        ----------
+        media_id: :class:`int`
+            The id of the anime or manga.
+        count: Optional[:class:`int`]
+            The number of results, at most ``k``.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`float`]]
+        """
+        if (row := self._rows.get(media_id)) is None or self._neighbours is None or self._scores is None:
+            return []
+
+        neighbours: Sequence[int] = self._neighbours[row][:count].tolist()
+        scores: Sequence[float] = self._scores[row][:count].tolist()
+        return [(self._ids[index], score) for index, score in zip(neighbours, scores)]
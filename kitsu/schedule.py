@@ -0,0 +1,190 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .enums import Status
+from .models import Anime, Episode
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .mirror import Mirror
+
+__all__ = ("AiringCalendar", "Airing")
+
+_log = logging.getLogger(__name__)
+
+
+class Airing:
+    """Represents an Episode airing on a date, as returned by :class:`AiringCalendar`.
+
+    Attributes
+    ----------
+    airdate: :class:`datetime.date`
+        The date the Episode airs.
+    anime_id: :class:`int`
+        The id of the Anime the Episode belongs to.
+    episode: :class:`Episode`
+        The Episode.
+    """
+
+    __slots__ = ("airdate", "anime_id", "episode")
+
+    def __init__(self, airdate: date, anime_id: int, episode: Episode) -> None:
+        self.airdate = airdate
+        self.anime_id = anime_id
+        self.episode = episode
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Airing airdate={self.airdate} anime_id={self.anime_id} episode={self.episode.number}>"
+
+
+class AiringCalendar:
+    """An index of Episode airdates answering schedule queries locally.
+
+    Episodes are kept sorted by airdate, so date range queries are a binary
+    search. The calendar is built from the episodes in a :class:`Mirror`, and
+    :meth:`refresh` fetches episodes only for the anime in the mirror whose
+    status is :attr:`Status.current`. Fetched episodes are also stored in the
+    mirror with their anime linked, so a saved mirror rebuilds the calendar.
+
+    Parameters
+    ----------
+    mirror: :class:`Mirror`
+        The mirror holding the anime and episodes.
+    """
+
+    def __init__(self, mirror: Mirror) -> None:
+        self.mirror = mirror
+        self._entries: List[Tuple[str, int, int]] = []
+        self._keys: Dict[int, Tuple[str, int, int]] = {}
+
+        for resource in mirror.resources("episodes"):
+            if (media := resource.get("relationships", {}).get("media", {}).get("data")) is not None:
+                self.add(int(media["id"]), resource)
+
+    def __repr__(self) -> str:
+        return f"<kitsu.AiringCalendar episodes={len(self._entries)}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, anime_id: int, resource: Dict[str, Any]) -> None:
+        """Adds or moves a raw episode resource of the given anime in the calendar."""
+        episode_id = int(resource["id"])
+
+        if (key := self._keys.pop(episode_id, None)) is not None:
+            del self._entries[bisect_left(self._entries, key)]
+
+        if (airdate := resource["attributes"].get("airdate")) is None:
+            return
+
+        key = (airdate[:10], anime_id, episode_id)
+        self._keys[episode_id] = key
+        insort(self._entries, key)
+
+    def between(self, start: date, end: date) -> List[Airing]:
+        """Returns the Episodes airing from ``start`` to ``end``, both inclusive, ordered by airdate.
+
+        Parameters
+        ----------
+        start: :class:`datetime.date`
+            The first date of the range.
+        end: :class:`datetime.date`
+            The last date of the range.
+
+        Returns
+        -------
+        List[:class:`Airing`]
+        """
+        low = bisect_left(self._entries, (start.isoformat(),))
+        high = bisect_right(self._entries, (end.isoformat(), float("inf")), low)
+        airings = []
+
+        for airdate, anime_id, episode_id in self._entries[low:high]:
+            if (resource := self.mirror.get("episodes", episode_id)) is not None:
+                airings.append(Airing(date.fromisoformat(airdate), anime_id, Episode(resource)))  # type: ignore
+
+        return airings
+
+    def week(self, day: Optional[date] = None) -> List[Airing]:
+        """Returns the Episodes airing in the week from Monday to Sunday containing ``day``, defaulting to today."""
+        day = day or date.today()
+        monday = day - timedelta(days=day.weekday())
+        return self.between(monday, monday + timedelta(days=6))
+
+    def airing(self) -> List[Anime]:
+        """Returns the anime in the mirror which are currently airing."""
+        return [anime for anime in self.mirror.anime() if anime.status is Status.current]
+
+    async def _fetch(self, client: Client, anime_id: int, *, latest: bool) -> None:
+        params = {"page[limit]": 20, "sort": "-number"}
+        data = await client._request(f"anime/{anime_id}/episodes", params=params)
+
+        while True:
+            for resource in data["data"]:
+                resource.setdefault("relationships", {})["media"] = {"data": {"type": "anime", "id": str(anime_id)}}
+                self.mirror.upsert(resource)
+                self.add(anime_id, resource)
+
+            if latest or (next_page := data["links"].get("next")) is None:
+                break
+
+            data = await client._request(url=next_page)
+
+    async def refresh(self, client: Client, *, concurrency: int = 4) -> int:
+        """Fetches the latest episodes of every currently airing anime in the mirror.
+
+        Anime which already have episodes in the calendar only have their latest
+        page of episodes fetched, the others have every page fetched.
+
+        Parameters
+        ----------
+        client: :class:`Client`
+            The client to fetch the episodes with.
+        concurrency: :class:`int`, default: 4
+            The maximum number of anime fetched at once.
+
+        Returns
+        -------
+        :class:`int`
+            The number of anime refreshed.
+        """
+        known = {anime_id for _, anime_id, _ in self._entries}
+        airing = [anime.id for anime in self.airing()]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(anime_id: int) -> None:
+            async with semaphore:
+                await self._fetch(client, anime_id, latest=anime_id in known)
+
+        await asyncio.gather(*(fetch(anime_id) for anime_id in airing))
+
+        _log.info("Refreshed the episodes of %s airing anime", len(airing))
+        return len(airing)
@@ -0,0 +1,361 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .enums import AgeRating, Season
+from .models import Anime, Manga
+
+if TYPE_CHECKING:
+    from .categories import CategoryRegistry
+    from .mirror import Mirror, MirrorChange
+
+__all__ = ("SearchIndex",)
+
+Media = Union[Anime, Manga]
+
+_TOKEN = re.compile(r"\w+")
+
+# Scores of a query token matching a title token exactly, as a prefix or within one edit
+_EXACT, _PREFIX, _FUZZY = 3, 2, 1
+
+
+def _normalize(text: str) -> str:
+    # Accents are stripped from latin letters only, kana keep their voicing marks
+    kept: List[str] = []
+
+    for char in unicodedata.normalize("NFKD", text.casefold()):
+        if not (unicodedata.combining(char) and kept and kept[-1] < "\u0250"):
+            kept.append(char)
+
+    return unicodedata.normalize("NFC", "".join(kept))
+
+
+def _tokenize(text: str) -> List[str]:
+    """Splits text into words, and words in scripts written without spaces into character bigrams."""
+    tokens = []
+
+    for word in _TOKEN.findall(_normalize(text)):
+        if len(word) > 2 and word[0] >= "\u2e80":
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+
+    return tokens
+
+
+def _deletions(token: str) -> Set[str]:
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+def _season(media: Media) -> Optional[Tuple[int, Season]]:
+    """Returns the season year and season a media started in, December counts towards the next year."""
+    if (start := media._attributes.get("startDate")) is None:
+        return None
+
+    year, month = int(start[:4]), int(start[5:7])
+
+    if month == 12:
+        return year + 1, Season.winter
+
+    return year, (Season.winter, Season.spring, Season.summer, Season.fall)[month // 3]
+
+
+class SearchIndex:
+    """An in-memory inverted index answering the same queries as :meth:`Client.search_anime` locally.
+
+    Titles in every language, abbreviated titles and slugs are indexed, and a query
+    matches titles containing every one of its words, either exactly, as a prefix
+    or within one typo. Results are ranked by how closely they match, then by
+    their number of users.
+
+    Parameters
+    ----------
+    media: Iterable[Union[:class:`Anime`, :class:`Manga`]]
+        The anime and manga to index.
+    """
+
+    def __init__(self, media: Iterable[Media] = ()) -> None:
+        self._documents: Dict[int, Media] = {}
+        self._numbers: Dict[Tuple[str, int], int] = {}
+        self._terms: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._sorted: List[str] = []
+        self._deleted: Dict[str, Set[str]] = {}
+        self._filters: Dict[Tuple[str, object], Set[int]] = {}
+        self._years: Dict[int, Set[int]] = {}
+        # Every document by descending number of users, for ranking queries without text
+        self._popular: List[Tuple[int, int]] = []
+        self._next = 0
+
+        for item in media:
+            self.add(item)
+
+    def __repr__(self) -> str:
+        return f"<kitsu.SearchIndex documents={len(self._documents)} terms={len(self._postings)}>"
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @classmethod
+    def from_mirror(
+        cls,
+        mirror: Mirror,
+        *,
+        categories: Optional[Mapping[Tuple[str, int], Iterable[str]]] = None,
+        registry: Optional[CategoryRegistry] = None,
+        follow: bool = False,
+    ) -> SearchIndex:
+        """Builds an index of the anime and manga in a :class:`Mirror`.
+
+        Parameters
+        ----------
+        mirror: :class:`Mirror`
+            The mirror to index.
+        categories: Optional[Mapping[Tuple[:class:`str`, :class:`int`], Iterable[:class:`str`]]]
+            The category slugs or titles of each media, by type and id.
+        registry: Optional[:class:`CategoryRegistry`]
+            A loaded registry resolving the ``categories`` relationship of media
+            that are not in ``categories``, when they were fetched with it included.
+        follow: :class:`bool`, default: False
+            Whether to keep the index updated as changes are applied to the mirror.
+        """
+        categories = categories or {}
+
+        def categories_of(resource: Dict[str, Any]) -> Iterable[str]:
+            key = (resource["type"], int(resource["id"]))
+            if key in categories:
+                return categories[key]
+            if registry is None:
+                return ()
+            data = resource.get("relationships", {}).get("categories", {}).get("data") or ()
+            return [
+                name
+                for category in registry.resolve(item["id"] for item in data)
+                for name in (category.slug, category.title)
+            ]
+
+        index = cls()
+
+        for kind in ("anime", "manga"):
+            for resource in mirror.resources(kind):
+                index.add(mirror.model(resource), categories=categories_of(resource))  # type: ignore
+
+        if follow:
+
+            def apply(change: MirrorChange) -> None:
+                if change.type in ("anime", "manga"):
+                    index.add(mirror.model(change.resource), categories=categories_of(change.resource))  # type: ignore
+
+            mirror.add_listener(apply)
+
+        return index
+
+    def add(self, media: Media, *, categories: Iterable[str] = ()) -> None:
+        """Adds a media to the index, replacing the indexed version of it if there is one.
+
+        Parameters
+        ----------
+        media: Union[:class:`Anime`, :class:`Manga`]
+            The media to index.
+        categories: Iterable[:class:`str`]
+            The slugs or titles of the media's categories, for filtering by category.
+        """
+        kind = "anime" if isinstance(media, Anime) else "manga"
+        self.remove(kind, media.id)
+
+        number = self._next
+        self._next += 1
+        self._documents[number] = media
+        self._numbers[(kind, media.id)] = number
+        insort(self._popular, (-(media.user_count or 0), number))
+
+        texts = [
+            *media._titles.values(),
+            media.canonical_title,
+            *(media.abbreviated_titles or ()),
+            media.slug.replace("-", " "),
+        ]
+        terms = {token for text in texts if text for token in _tokenize(text)}
+        self._terms[number] = terms
+
+        for term in terms:
+            if (postings := self._postings.get(term)) is None:
+                postings = self._postings[term] = set()
+                insort(self._sorted, term)
+
+                for deleted in _deletions(term) | {term}:
+                    self._deleted.setdefault(deleted, set()).add(term)
+
+            postings.add(number)
+
+        keys: List[Tuple[str, object]] = [("kind", kind), ("age_rating", media.age_rating)]
+
+        if (season := _season(media)) is not None:
+            self._years.setdefault(season[0], set()).add(number)
+            keys.append(("season", season[1]))
+
+        keys += [("category", _normalize(category)) for category in categories]
+
+        for key in keys:
+            self._filters.setdefault(key, set()).add(number)
+
+    def remove(self, kind: str, media_id: int) -> None:
+        """Removes a media from the index, if it is indexed."""
+        if (number := self._numbers.pop((kind, media_id), None)) is None:
+            return
+
+        media = self._documents.pop(number)
+        del self._popular[bisect_left(self._popular, (-(media.user_count or 0), number))]
+
+        for term in self._terms.pop(number):
+            postings = self._postings[term]
+            postings.discard(number)
+
+            if not postings:
+                del self._postings[term]
+                del self._sorted[bisect_left(self._sorted, term)]
+
+                for deleted in _deletions(term) | {term}:
+                    self._deleted[deleted].discard(term)
+
+        for numbers in (*self._filters.values(), *self._years.values()):
+            numbers.discard(number)
+
+    def _match(self, token: str) -> Dict[int, int]:
+        """Returns the best score of every document matching a query token."""
+        scores: Dict[int, int] = {}
+
+        def score(terms: Iterable[str], value: int) -> None:
+            for term in terms:
+                for number in self._postings[term]:
+                    if scores.get(number, 0) < value:
+                        scores[number] = value
+
+        start = bisect_left(self._sorted, token)
+        end = bisect_left(self._sorted, token + "\U0010ffff", start)
+
+        if start < end:
+            score(self._sorted[start:end], _PREFIX)
+
+        if len(token) > 3:
+            candidates = set(self._deleted.get(token, ()))
+
+            for deleted in _deletions(token):
+                candidates |= self._deleted.get(deleted, set())
+
+            score(candidates, _FUZZY)
+
+        if token in self._postings:
+            score((token,), _EXACT)
+
+        return scores
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        *,
+        limit: int = 10,
+        kind: Optional[str] = None,
+        after_year: Optional[int] = None,
+        before_year: Optional[int] = None,
+        season: Optional[List[Season]] = None,
+        age_rating: Optional[List[AgeRating]] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[Media]:
+        """Searches the index with the filters of :meth:`Client.search_anime`.
+
+        Parameters
+        ----------
+        text: Optional[:class:`str`]
+            The text to match against the titles.
+        limit: :class:`int`, default: 10
+            The maximum number of results.
+        kind: Optional[Literal["anime", "manga"]]
+            Only return anime or only return manga.
+        after_year: Optional[:class:`int`]
+            The lower limit of the season year.
+        before_year: Optional[:class:`int`]
+            The upper limit of the season year.
+        season: Optional[List[:class:`Season`]]
+            The release season(s) to filter by.
+        age_rating: Optional[List[:class:`AgeRating`]]
+            The age rating(s) to filter by.
+        categories: Optional[List[:class:`str`]]
+            The categories every result must have.
+
+        Returns
+        -------
+        List[Union[:class:`Anime`, :class:`Manga`]]
+        """
+        candidates: Optional[Set[int]] = None
+
+        def narrow(numbers: Set[int]) -> None:
+            nonlocal candidates
+            candidates = numbers if candidates is None else candidates & numbers
+
+        if kind is not None:
+            narrow(self._filters.get(("kind", kind), set()))
+
+        if after_year is not None or before_year is not None:
+            low, high = after_year or 0, before_year or 9999
+            narrow(set().union(*(numbers for year, numbers in self._years.items() if low <= year <= high)))
+
+        if season is not None:
+            narrow(set().union(*(self._filters.get(("season", item), set()) for item in season)))
+
+        if age_rating is not None:
+            narrow(set().union(*(self._filters.get(("age_rating", item), set()) for item in age_rating)))
+
+        for category in categories or ():
+            narrow(self._filters.get(("category", _normalize(category)), set()))
+
+        if text is None or not (tokens := _tokenize(text)):
+            if candidates is None:
+                ranked = [number for _, number in self._popular[:limit]]
+            elif len(candidates) * 16 < len(self._popular):
+                ranked = heapq.nsmallest(limit, candidates, key=lambda n: (-(self._documents[n].user_count or 0), n))
+            else:
+                ranked = list(itertools.islice((number for _, number in self._popular if number in candidates), limit))
+
+            return [self._documents[number] for number in ranked]
+
+        scores: Dict[int, int] = {}
+
+        for position, token in enumerate(tokens):
+            matches = self._match(token)
+
+            if position == 0:
+                scores = matches if candidates is None else {n: s for n, s in matches.items() if n in candidates}
+            else:
+                scores = {n: s + matches[n] for n, s in scores.items() if n in matches}
+
+        ranked = heapq.nsmallest(limit, scores, key=lambda n: (-scores[n], -(self._documents[n].user_count or 0)))
+        return [self._documents[number] for number in ranked]
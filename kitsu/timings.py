@@ -0,0 +1,193 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from contextlib import contextmanager
+from time import perf_counter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, TraceConnectionCreateEndParams, TraceDnsResolveHostEndParams
+
+__all__ = ("RequestTimings",)
+
+_log = logging.getLogger(__name__)
+
+
+class RequestTimings:
+    """Represents the time spent in each stage of a request to the Kitsu API.
+
+    All durations are in seconds and are ``None`` when the stage did not happen,
+    e.g. ``dns`` and ``connect`` are ``None`` when a pooled connection was reused.
+    A record is dispatched for every sampled request once its body is decoded, and
+    the construction of models is dispatched as separate records with the ``BUILD`` method.
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the request, or ``BUILD`` for a model construction record.
+    url: :class:`str`
+        The URL of the request, or the name of the model for a model construction record.
+    status: Optional[:class:`int`]
+        The HTTP status code of the response.
+    dns: Optional[:class:`float`]
+        The time spent resolving the host name.
+    connect: Optional[:class:`float`]
+        The time spent opening a new connection.
+    ttfb: Optional[:class:`float`]
+        The time until the response headers were received, this includes ``dns`` and ``connect``.
+    body: Optional[:class:`float`]
+        The time spent reading the response body.
+    decode: Optional[:class:`float`]
+        The time spent decoding the JSON response body.
+    build: Optional[:class:`float`]
+        The time spent constructing models, only set on model construction records.
+    model: Optional[:class:`str`]
+        The name of the constructed model, only set on model construction records.
+    """
+
+    __slots__ = (
+        "_hook",
+        "_start",
+        "method",
+        "url",
+        "status",
+        "dns",
+        "connect",
+        "ttfb",
+        "body",
+        "decode",
+        "build",
+        "model",
+    )
+
+    def __init__(self, method: str, url: str, hook: Optional[Callable[[RequestTimings], Any]] = None) -> None:
+        self._hook = hook
+        self._start = perf_counter()
+
+        self.method = method
+        self.url = url
+        self.status: Optional[int] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.body: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.build: Optional[float] = None
+        self.model: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<kitsu.RequestTimings method={self.method} url={self.url} total={self.total:.4f}>"
+
+    @property
+    def total(self) -> float:
+        """The sum of all the recorded stages."""
+        return sum(filter(None, (self.ttfb, self.body, self.decode, self.build)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the timings as a dictionary, suitable for structured logging."""
+        return {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "dns": self.dns,
+            "connect": self.connect,
+            "ttfb": self.ttfb,
+            "body": self.body,
+            "decode": self.decode,
+            "build": self.build,
+            "model": self.model,
+            "total": self.total,
+        }
+
+    def _dispatch(self) -> None:
+        _log.debug(
+            "%s %s took %.4fs (ttfb=%s body=%s decode=%s build=%s)",
+            self.method,
+            self.url,
+            self.total,
+            self.ttfb,
+            self.body,
+            self.decode,
+            self.build,
+            extra={"kitsu_timings": self.to_dict()},
+        )
+
+        if self._hook is not None:
+            self._hook(self)
+
+
+@contextmanager
+def build_timer(model: str, hook: Optional[Callable[[RequestTimings], Any]], sample_rate: float) -> Iterator[None]:
+    """Times the construction of models for a sample of the calls and dispatches it as its own record.
+
+    The record has the ``BUILD`` method and the name of the model as its URL, so it
+    is not tied to a request. Models are often built from several requests at once.
+    """
+    if not sample_rate or random.random() >= sample_rate:
+        yield
+        return
+
+    record = RequestTimings("BUILD", model, hook)
+    record.model = model
+    start = perf_counter()
+
+    try:
+        yield
+    finally:
+        record.build = perf_counter() - start
+        record._dispatch()
+
+
+async def _on_dns_start(session: ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+    ctx.dns_start = perf_counter()
+
+
+async def _on_dns_end(session: ClientSession, ctx: SimpleNamespace, params: TraceDnsResolveHostEndParams) -> None:
+    if isinstance(ctx.trace_request_ctx, RequestTimings):
+        ctx.trace_request_ctx.dns = perf_counter() - ctx.dns_start
+
+
+async def _on_connect_start(session: ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+    ctx.connect_start = perf_counter()
+
+
+async def _on_connect_end(session: ClientSession, ctx: SimpleNamespace, params: TraceConnectionCreateEndParams) -> None:
+    if isinstance(ctx.trace_request_ctx, RequestTimings):
+        ctx.trace_request_ctx.connect = perf_counter() - ctx.connect_start
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Creates the :class:`aiohttp.TraceConfig` which records DNS and connect times."""
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connect_start)
+    config.on_connection_create_end.append(_on_connect_end)
+    return config
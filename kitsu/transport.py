@@ -0,0 +1,243 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+from collections import defaultdict, deque
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Deque, Dict, Mapping, Optional, TextIO, Tuple
+
+import aiohttp
+from yarl import URL
+
+from .errors import ReplayMiss
+from .timings import trace_config
+
+if TYPE_CHECKING:
+    from .timings import RequestTimings
+
+__all__ = ("Transport", "Response", "HTTPTransport", "RecordingTransport", "ReplayTransport")
+
+
+def _request_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Returns a stable key for a request, independent of the host and the order of its query parameters."""
+    target = URL(url)
+
+    if params:
+        target = target.update_query({key: str(value) for key, value in params.items()})
+
+    return f"{method.upper()} {target.with_query(sorted(target.query.items())).path_qs}"
+
+
+class Response:
+    """Represents a response returned by a :class:`Transport`.
+
+    Attributes
+    ----------
+    status: :class:`int`
+        The HTTP status code of the response.
+    body: :class:`bytes`
+        The raw body of the response.
+    raw: Optional[:class:`~aiohttp.ClientResponse`]
+        The underlying aiohttp response, if the response came from the network.
+    """
+
+    __slots__ = ("status", "body", "raw")
+
+    def __init__(self, status: int, body: bytes, raw: Optional[aiohttp.ClientResponse] = None) -> None:
+        self.status = status
+        self.body = body
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"<kitsu.Response status={self.status} size={len(self.body)}>"
+
+
+class Transport:
+    """The base class for the layer that performs requests on behalf of :class:`Client`.
+
+    Subclasses implement :meth:`request` and optionally :meth:`close`.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> Response:
+        """Performs a request and returns its :class:`Response`."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases the resources held by this transport."""
+        pass
+
+
+class HTTPTransport(Transport):
+    """The default transport, which performs requests over an :class:`aiohttp.ClientSession`.
+
+    Parameters
+    ----------
+    session: Optional[:class:`aiohttp.ClientSession`]
+        The aiohttp client session to use. DNS and connect timings are only
+        recorded when the transport creates its own session.
+    """
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
+        self.session = session or aiohttp.ClientSession(trace_configs=[trace_config()])
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> Response:
+        kwargs: Dict[str, Any] = {"params": params, "headers": headers}
+
+        if timings is not None:
+            kwargs["trace_request_ctx"] = timings
+
+        async with self.session.request(method=method, url=url, **kwargs) as response:
+            start = perf_counter()
+
+            if timings is not None:
+                timings.status = response.status
+                timings.ttfb = start - timings._start
+
+            body = await response.read()
+
+            if timings is not None:
+                timings.body = perf_counter() - start
+
+            return Response(response.status, body, response)
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+class RecordingTransport(Transport):
+    """A transport which performs requests with another transport and records them to a cassette.
+
+    The cassette is a gzip compressed file with one JSON line per response,
+    it is appended to so several runs can record into the same file. Bodies
+    which are not UTF-8 text, such as images, are stored base64 encoded.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the cassette to write to.
+    transport: Optional[:class:`Transport`]
+        The transport to perform the requests with, defaults to :class:`HTTPTransport`.
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None) -> None:
+        self.transport = transport or HTTPTransport()
+        self._file: TextIO = gzip.open(path, "at", encoding="utf-8")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> Response:
+        response = await self.transport.request(method, url, params=params, headers=headers, timings=timings)
+
+        entry: Dict[str, Any] = {"key": _request_key(method, url, params), "status": response.status}
+
+        try:
+            entry["body"] = response.body.decode()
+        except UnicodeDecodeError:
+            entry["body"] = base64.b64encode(response.body).decode("ascii")
+            entry["encoding"] = "base64"
+
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        return response
+
+    async def close(self) -> None:
+        self._file.close()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """A transport which serves responses from a cassette written by :class:`RecordingTransport`.
+
+    Requests are matched by method, path and query parameters, so a cassette
+    recorded against one host can be replayed for another. When a request was
+    recorded several times the responses are served in the recorded order, and
+    the last one is repeated once they run out.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the cassette to read from.
+    latency: :class:`float`, default: 0.0
+        Seconds to wait before returning each response, to simulate the network.
+    """
+
+    def __init__(self, path: str, *, latency: float = 0.0) -> None:
+        self.latency = latency
+        self._responses: Dict[str, Deque[Tuple[int, bytes]]] = defaultdict(deque)
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                body = base64.b64decode(entry["body"]) if entry.get("encoding") == "base64" else entry["body"].encode()
+                self._responses[entry["key"]].append((entry["status"], body))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> Response:
+        key = _request_key(method, url, params)
+
+        if not (recorded := self._responses.get(key)):
+            raise ReplayMiss(key)
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        status, body = recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+        if timings is not None:
+            timings.status = status
+            timings.ttfb = perf_counter() - timings._start
+
+        return Response(status, body)
@@ -0,0 +1,65 @@
+"""
+MIT License
+
+Copyright (c) 2021-present MrArkon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from typing import List, Literal, Optional, TypedDict
+
+from .common import CollectionLinks, CollectionMeta, Links, Relationship
+
+__all__ = ("CategoryCollection", "CategoryData", "CategoryResource")
+
+
+class CategoryAttributes(TypedDict):
+    createdAt: str
+    updatedAt: str
+    title: str
+    description: Optional[str]
+    slug: str
+    nsfw: bool
+    childCount: int
+    totalMediaCount: int
+
+
+class CategoryRelationships(TypedDict):
+    parent: Relationship
+    anime: Relationship
+    manga: Relationship
+
+
+class CategoryData(TypedDict):
+    id: str
+    type: Literal["categories"]
+    links: Links
+    attributes: CategoryAttributes
+    relationships: CategoryRelationships
+
+
+class CategoryResource(TypedDict):
+    data: CategoryData
+
+
+class CategoryCollection(TypedDict):
+    data: List[CategoryData]
+    meta: CollectionMeta
+    links: CollectionLinks